@@ -1,11 +1,14 @@
+import functools
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
 
-from flask import Flask, redirect, render_template, request, url_for
+from flask import Flask, g, redirect, render_template, request, url_for
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flask_wtf.csrf import CSRFProtect
+from flask_wtf.csrf import CSRFProtect, generate_csrf
+from werkzeug.exceptions import HTTPException
 
 from config import Config
 from constants import (
@@ -16,25 +19,27 @@ from constants import (
     RATELIMIT_START_TEST,
 )
 from question_validator import QuestionValidationError, validate_questions_file
+from questions_cache import get_cache_path, load_cached_questions, save_questions_cache
 from services import (
+    build_category_index,
     build_review_data,
     calculate_score_percentage,
-    create_shuffle_mappings,
-    filter_questions_by_categories,
+    count_questions_for_categories,
+    create_shuffle_seed,
+    freeze_question,
+    get_indices_for_categories,
     handle_answer_submission,
     prepare_question_for_display,
-    select_random_questions,
+    select_random_indices,
     validate_and_parse_user_answer,
 )
 from session_helpers import (
-    add_to_score,
-    add_wrong_answer,
     get_current_question_data,
     get_review_data,
     get_score_data,
     get_server_timestamp,
-    increment_question_index,
     initialize_test_session,
+    record_answer,
     sanitize_score,
     validate_client_timestamp,
     validate_time_remaining,
@@ -45,6 +50,7 @@ from validators import (
     ValidationError,
     validate_categories,
     validate_num_questions,
+    validate_question_index_in_range,
     validate_session_question_index,
     validate_shuffle_option,
     validate_time_limit,
@@ -57,16 +63,27 @@ app = Flask(__name__)
 config = Config()
 config.setup_logging()
 config.apply_to_flask_app(app)
+config.setup_session_backend(app)
+config.setup_template_cache(app)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 csrf = CSRFProtect(app)
 
+
+def get_client_address() -> str:
+    """Resolve the client address once per request and reuse it for every rate limit."""
+    if "client_address" not in g:
+        g.client_address = get_remote_address()
+    client_address: str = g.client_address
+    return client_address
+
+
 # Initialize rate limiter
 limiter = Limiter(
     app=app,
-    key_func=get_remote_address,
+    key_func=get_client_address,
     default_limits=RATELIMIT_DEFAULT,  # type: ignore[arg-type]
     storage_uri=config.RATELIMIT_STORAGE_URI,
     strategy="fixed-window",
@@ -94,6 +111,15 @@ def load_questions() -> List[Dict[str, Any]]:
     base_dir = Path(__file__).parent
     questions_file = base_dir / "data" / "questions.json"
     schema_file = base_dir / "data" / "questions_schema.json"
+    # The validator is a source too: changing the validation rules must invalidate the cache
+    source_files = [questions_file, schema_file, base_dir / "question_validator.py"]
+    cache_file = get_cache_path(questions_file)
+
+    # Reuse the previously validated questions while neither file has changed
+    cached_questions = load_cached_questions(cache_file, source_files)
+    if cached_questions:
+        logger.info("Loaded %d questions from cache", len(cached_questions))
+        return cached_questions
 
     # Validate and load questions with schema validation
     try:
@@ -108,6 +134,7 @@ def load_questions() -> List[Dict[str, Any]]:
             raise ValueError("Questions file must contain a non-empty JSON array")
 
         logger.info("Successfully loaded and validated %d questions", len(validated_questions))
+        save_questions_cache(cache_file, source_files, validated_questions)
         return validated_questions
 
     except QuestionValidationError as e:
@@ -115,7 +142,7 @@ def load_questions() -> List[Dict[str, Any]]:
         raise
 
 
-def get_unique_categories(questions_list: List[Dict[str, Any]]) -> List[str]:
+def get_unique_categories(questions_list: Sequence[Mapping[str, Any]]) -> List[str]:
     """Extract unique categories from questions."""
     categories: Set[str] = set()
     for question in questions_list:
@@ -124,16 +151,43 @@ def get_unique_categories(questions_list: List[Dict[str, Any]]) -> List[str]:
     return sorted(categories)
 
 
-def get_category_counts(questions_list: List[Dict[str, Any]]) -> Dict[str, int]:
+def get_category_counts(questions_list: Sequence[Mapping[str, Any]]) -> Dict[str, int]:
     """Count questions per category."""
-    counts: Dict[str, int] = {}
-    for question in questions_list:
-        category = question.get("category", "Unknown")
-        counts[category] = counts.get(category, 0) + 1
-    return counts
+    return dict(Counter(question.get("category", "Unknown") for question in questions_list))
+
 
+# Questions are shared read-only by every request
+questions: Tuple[Mapping[str, Any], ...] = tuple(freeze_question(q) for q in load_questions())
 
-questions: List[Dict[str, Any]] = load_questions()
+# Question metadata is immutable after load, so derive it once instead of per request
+CATEGORIES: List[str] = get_unique_categories(questions)
+CATEGORY_SET: FrozenSet[str] = frozenset(CATEGORIES)
+CATEGORY_COUNTS: Dict[str, int] = get_category_counts(questions)
+TOTAL_QUESTIONS: int = len(questions)
+CATEGORY_INDEX: Dict[str, List[int]] = build_category_index(questions)
+
+# Substituted with the session's CSRF token when serving the cached landing page
+CSRF_TOKEN_PLACEHOLDER = "__csrf_token_placeholder__"
+
+
+@functools.lru_cache(maxsize=1)
+def render_start_page() -> str:
+    """Render the landing page once; only its CSRF token differs between users."""
+    return render_template(
+        "start.html",
+        total_questions=TOTAL_QUESTIONS,
+        categories=CATEGORIES,
+        category_counts=CATEGORY_COUNTS,
+        csrf_token=lambda: CSRF_TOKEN_PLACEHOLDER,
+    )
+
+
+@app.after_request
+def set_cache_headers(response: Any) -> Any:
+    """Prevent caching of pages that carry session or CSRF state."""
+    if request.endpoint != "static":
+        response.headers.setdefault("Cache-Control", "private, no-store")
+    return response
 
 
 @app.route("/")
@@ -142,14 +196,7 @@ def start() -> str:
     """
     This is the landing page that displays the start screen.
     """
-    categories: List[str] = get_unique_categories(questions)
-    category_counts: Dict[str, int] = get_category_counts(questions)
-    return render_template(
-        "start.html",
-        total_questions=len(questions),
-        categories=categories,
-        category_counts=category_counts,
-    )
+    return render_start_page().replace(CSRF_TOKEN_PLACEHOLDER, generate_csrf())
 
 
 @app.route("/start-test", methods=["POST"])
@@ -158,54 +205,40 @@ def start_test() -> Any:
     """
     Initialize the test state and redirect to the first question.
     """
-    try:
-        # Get and validate selected categories
-        selected_categories: List[str] = request.form.getlist("categories")
-        valid_categories: List[str] = get_unique_categories(questions)
-        validate_categories(selected_categories, valid_categories)
-
-        # Filter questions by selected categories
-        filtered_questions: List[Dict[str, Any]] = filter_questions_by_categories(
-            questions, selected_categories
-        )
+    # Get and validate selected categories
+    selected_categories: List[str] = validate_categories(
+        request.form.getlist("categories"), CATEGORY_SET
+    )
 
-        if not filtered_questions:
-            raise ValidationError("No questions available for selected categories")
+    # Only the count is needed to validate the request
+    available_questions = count_questions_for_categories(CATEGORY_INDEX, selected_categories)
 
-        # Get and validate number of questions
-        num_questions: Optional[int] = request.form.get("num_questions", type=int)
-        num_questions = validate_num_questions(num_questions, len(filtered_questions))
+    if not available_questions:
+        raise ValidationError("No questions available for selected categories")
 
-        # Get and validate time limit
-        time_limit: Optional[int] = request.form.get("time_limit", type=int)
-        time_limit = validate_time_limit(time_limit)
+    # Get and validate number of questions
+    num_questions: Optional[int] = request.form.get("num_questions", type=int)
+    num_questions = validate_num_questions(num_questions, available_questions)
 
-        # Get and validate shuffle option
-        shuffle_answers_str: str = request.form.get("shuffle_answers", "false")
-        shuffle_answers: bool = validate_shuffle_option(shuffle_answers_str)
+    # Get and validate time limit
+    time_limit: Optional[int] = request.form.get("time_limit", type=int)
+    time_limit = validate_time_limit(time_limit)
 
-        # Select random questions
-        selected_questions: List[Dict[str, Any]] = select_random_questions(
-            filtered_questions, num_questions
-        )
-        selected_indices: List[int] = [questions.index(q) for q in selected_questions]
+    # Get and validate shuffle option
+    shuffle_answers_str: str = request.form.get("shuffle_answers", "false")
+    shuffle_answers: bool = validate_shuffle_option(shuffle_answers_str)
 
-        # Create shuffle mappings if needed
-        shuffle_mappings: Dict[int, Dict[str, Any]] = {}
-        if shuffle_answers:
-            shuffle_mappings = create_shuffle_mappings(selected_indices, questions)
+    # Collect question indices for the selected categories and sample from them
+    filtered_indices = get_indices_for_categories(CATEGORY_INDEX, selected_categories)
+    selected_indices: List[int] = select_random_indices(filtered_indices, num_questions)
 
-        # Initialize session
-        initialize_test_session(selected_indices, shuffle_mappings, time_limit, shuffle_answers)
+    # Option order is derived from a per-test seed rather than stored per question
+    shuffle_seed: Optional[int] = create_shuffle_seed() if shuffle_answers else None
 
-        return redirect(url_for("show_question"))
+    # Initialize session
+    initialize_test_session(selected_indices, shuffle_seed, time_limit, shuffle_answers)
 
-    except ValidationError as e:
-        logger.warning("Validation error in start_test: %s", e.message)
-        return (
-            render_template("error.html", error_code=e.code, error_message=e.message),
-            e.code,
-        )
+    return redirect(url_for("show_question"))
 
 
 @app.route("/question", methods=["GET"])
@@ -214,44 +247,50 @@ def show_question() -> Any:
     """
     Display the current question.
     """
-    try:
-        # Validate time remaining
-        time_valid, remaining_time = validate_time_remaining()
-        if not time_valid:
-            return redirect(url_for("show_score"))
-
-        # Get and validate session data
-        q_index, selected_indices, shuffle_mappings = get_current_question_data()
-        q_index, selected_indices = validate_session_question_index(q_index, selected_indices)
-
-        # Check if quiz is complete
-        if q_index >= len(selected_indices):
-            return redirect(url_for("show_score"))
-
-        # Prepare question for display
-        current_question = prepare_question_for_display(
-            q_index, selected_indices, questions, shuffle_mappings
-        )
+    # Validate time remaining
+    time_valid, remaining_time = validate_time_remaining()
+    if not time_valid:
+        return redirect(url_for("show_score"))
 
-        # Get server timestamp for clock skew detection
-        server_timestamp = get_server_timestamp()
-
-        # Render question template
-        return render_template(
-            "question.html",
-            question_data=current_question,
-            question_number=q_index + 1,
-            total_questions=len(selected_indices),
-            remaining_time=remaining_time,
-            server_timestamp=server_timestamp,
-        )
+    # Get and validate session data
+    q_index, selected_indices, shuffle_seed = get_current_question_data()
+    q_index, selected_indices = validate_session_question_index(q_index, selected_indices)
 
-    except ValidationError as e:
-        logger.error("Validation error in show_question: %s", e.message)
-        return (
-            render_template("error.html", error_code=e.code, error_message=e.message),
-            e.code,
-        )
+    # Check if quiz is complete
+    if q_index >= len(selected_indices):
+        return redirect(url_for("show_score"))
+
+    return _render_question(q_index, selected_indices, shuffle_seed, remaining_time)
+
+
+def _render_question(
+    q_index: int,
+    selected_indices: List[int],
+    shuffle_seed: Optional[int],
+    remaining_time: int,
+) -> str:
+    """Render the question at position q_index of the current test."""
+    # Prepare question for display
+    current_question = prepare_question_for_display(
+        q_index, selected_indices, questions, shuffle_seed
+    )
+
+    # Get server timestamp for clock skew detection
+    server_timestamp = get_server_timestamp()
+
+    return render_template(
+        "question.html",
+        question_data=current_question,
+        question_number=q_index + 1,
+        total_questions=len(selected_indices),
+        remaining_time=remaining_time,
+        server_timestamp=server_timestamp,
+    )
+
+
+def _is_stale_submission(question_number: Optional[int], q_index: int) -> bool:
+    """Check whether a submitted form belongs to a question other than the current one."""
+    return question_number is not None and question_number != q_index + 1
 
 
 def _validate_client_timestamp_with_logging(client_timestamp_str: Optional[str]) -> None:
@@ -273,89 +312,81 @@ def _validate_client_timestamp_with_logging(client_timestamp_str: Optional[str])
 
 def _process_answer_and_update_session(
     user_answer_int: Optional[int],
-    current_question_index: int,
     q_index: int,
-    current_question: Dict[str, Any],
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
+    question_index: int,
+    shuffle_seed: Optional[int],
 ) -> None:
-    """Process the answer and update session state."""
+    """Process the answer and record it (advancing to the next question) in the session."""
     if user_answer_int is None:
         logger.warning("Invalid answer format")
 
-    is_correct, wrong_answer_data = handle_answer_submission(
-        user_answer_int,
-        current_question_index,
-        q_index,
-        questions,
-        shuffle_mappings,
-        current_question,
+    is_correct, wrong_answer = handle_answer_submission(
+        user_answer_int, q_index, question_index, questions, shuffle_seed
     )
 
-    if is_correct:
-        add_to_score()
-    elif wrong_answer_data is not None:
-        add_wrong_answer(wrong_answer_data)
+    record_answer(is_correct, wrong_answer)
 
 
 @app.route("/submit-answer", methods=["POST"])
 @limiter.limit(RATELIMIT_QUESTION)
 def submit_answer() -> Any:
     """
-    Process the submitted answer and advance to the next question.
+    Process the submitted answer and render the next question in place.
+
+    Rendering the next question (or the final score) directly saves a redirect
+    round trip per answer.
     """
-    try:
-        # Validate client timestamp to detect clock skew
-        _validate_client_timestamp_with_logging(request.form.get("client_timestamp"))
+    form = request.form
 
-        # Validate time remaining
-        time_valid, _ = validate_time_remaining()
-        if not time_valid:
-            return redirect(url_for("show_score"))
+    # Validate client timestamp to detect clock skew
+    _validate_client_timestamp_with_logging(form.get("client_timestamp"))
 
-        # Get and validate session data
-        q_index, selected_indices, shuffle_mappings = get_current_question_data()
-        q_index, selected_indices = validate_session_question_index(q_index, selected_indices)
+    # Validate time remaining
+    time_valid, remaining_time = validate_time_remaining()
+    if not time_valid:
+        return _render_score()
 
-        # Check if quiz is complete
-        if q_index >= len(selected_indices):
-            return redirect(url_for("show_score"))
+    # Get and validate session data
+    q_index, selected_indices, shuffle_seed = get_current_question_data()
+    q_index, selected_indices = validate_session_question_index(q_index, selected_indices)
 
-        # Prepare current question (needed for validation)
-        current_question = prepare_question_for_display(
-            q_index, selected_indices, questions, shuffle_mappings
-        )
-        current_question_index = selected_indices[q_index]
-
-        # Parse and validate user answer
-        user_answer_str = request.form.get("option")
-        num_options = len(current_question.get("options", []))
-        user_answer_int = validate_and_parse_user_answer(user_answer_str, num_options)
-
-        # Process answer and update session
-        _process_answer_and_update_session(
-            user_answer_int,
-            current_question_index,
-            q_index,
-            current_question,
-            shuffle_mappings,
-        )
+    # Check if quiz is complete
+    if q_index >= len(selected_indices):
+        return _render_score()
 
-        # Move to next question
-        increment_question_index()
-        return redirect(url_for("show_question"))
+    # A resubmitted form (e.g. browser refresh) must not answer the next question
+    if _is_stale_submission(form.get("question_number", type=int), q_index):
+        logger.warning("Ignoring stale answer submission")
+        return _render_question(q_index, selected_indices, shuffle_seed, remaining_time)
 
-    except ValidationError as e:
-        logger.error("Validation error in submit_answer: %s", e.message)
-        return (
-            render_template("error.html", error_code=e.code, error_message=e.message),
-            e.code,
-        )
+    # Checking the answer only needs the option count, not the displayed question
+    question_index = selected_indices[q_index]
+    validate_question_index_in_range(question_index, TOTAL_QUESTIONS)
+
+    # Parse and validate user answer
+    num_options = len(questions[question_index]["options"])
+    user_answer_int = validate_and_parse_user_answer(form.get("option"), num_options)
+
+    # Process answer and update session
+    _process_answer_and_update_session(user_answer_int, q_index, question_index, shuffle_seed)
+
+    # Move to next question
+    q_index += 1
+    if q_index >= len(selected_indices):
+        return _render_score()
+
+    return _render_question(q_index, selected_indices, shuffle_seed, remaining_time)
 
 
 @app.route("/score")
 @limiter.limit(RATELIMIT_SCORE)
 def show_score() -> str:
     """Displays the final score to the user."""
+    return _render_score()
+
+
+def _render_score() -> str:
+    """Render the score page from the session's score data."""
     score, selected_indices, wrong_answers = get_score_data()
 
     # Validate and sanitize score
@@ -392,7 +423,7 @@ def show_score() -> str:
 @limiter.limit(RATELIMIT_SCORE)
 def review_wrong_answers() -> Any:
     """Display all wrong answers for review."""
-    wrong_answers, shuffle_mappings = get_review_data()
+    wrong_answers, selected_indices, shuffle_seed = get_review_data()
 
     # BACKEND VALIDATION: Ensure wrong_answers is a list
     if not isinstance(wrong_answers, list):
@@ -403,35 +434,52 @@ def review_wrong_answers() -> Any:
         return redirect(url_for("show_score"))
 
     # Build review data using service function
-    review_data = build_review_data(wrong_answers, questions, shuffle_mappings)
+    review_data = build_review_data(wrong_answers, selected_indices, questions, shuffle_seed)
 
     return render_template("review.html", review_data=review_data)
 
 
 # Error Handlers
+@functools.lru_cache(maxsize=32)
+def _render_error(error_code: int, error_message: str) -> str:
+    """Render the error page; it only depends on the code and message, so cache it."""
+    return render_template("error.html", error_code=error_code, error_message=error_message)
+
+
+@app.errorhandler(ValidationError)
+def validation_error_handler(e: ValidationError) -> Tuple[str, int]:
+    """Handle validation errors raised while processing a request."""
+    # 500-coded errors mean corrupt question data rather than a bad request
+    level = logging.ERROR if e.code >= 500 else logging.WARNING
+    logger.log(level, "Validation error in %s: %s", request.endpoint, e.message)
+    return _render_error(e.code, e.message), e.code
+
+
 @app.errorhandler(429)
 def ratelimit_handler(_error: Any) -> Tuple[str, int]:
     """Handle rate limit exceeded errors."""
-    return (
-        render_template(
-            "error.html",
-            error_code=429,
-            error_message="Too many requests. Please slow down and try again later.",
-        ),
-        429,
-    )
+    return _render_error(429, "Too many requests. Please slow down and try again later."), 429
 
 
 @app.errorhandler(404)
 def page_not_found(_error: Any) -> Tuple[str, int]:
     """Handle 404 errors."""
-    return render_template("error.html", error_code=404, error_message="Page not found"), 404
+    return _render_error(404, "Page not found"), 404
 
 
 @app.errorhandler(500)
 def internal_server_error(_error: Any) -> Tuple[str, int]:
     """Handle 500 errors."""
-    return render_template("error.html", error_code=500, error_message="Internal server error"), 500
+    return _render_error(500, "Internal server error"), 500
+
+
+@app.errorhandler(HTTPException)
+def http_exception_handler(e: HTTPException) -> Tuple[str, int, List[Tuple[str, str]]]:
+    """Handle other HTTP errors (e.g. 400 for a missing CSRF token, 405)."""
+    code = e.code or 500
+    # Keep headers the error defines, such as Allow on 405; the page sets its own Content-Type
+    headers = [(name, value) for name, value in e.get_headers() if name.lower() != "content-type"]
+    return _render_error(code, e.description or "Request failed"), code, headers
 
 
 @app.errorhandler(Exception)
@@ -441,10 +489,7 @@ def handle_exception(e: Exception) -> Tuple[str, int]:
     logger.error("Unhandled exception: %s", e, exc_info=True)
 
     # Return a generic error page
-    return (
-        render_template("error.html", error_code=500, error_message="An unexpected error occurred"),
-        500,
-    )
+    return _render_error(500, "An unexpected error occurred"), 500
 
 
 if __name__ == "__main__":
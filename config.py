@@ -70,8 +70,25 @@ class Config:
             hours=int(os.environ.get("SESSION_LIFETIME_HOURS", "2"))
         )
 
-        # Rate limiting
-        self.RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
+        # Server-side session storage (empty keeps Flask's signed-cookie sessions)
+        self.SESSION_TYPE = os.environ.get("SESSION_TYPE", "").lower()
+        self.SESSION_REDIS_URL = os.environ.get("SESSION_REDIS_URL", "redis://localhost:6379/0")
+        self.SESSION_FILE_DIR = os.environ.get(
+            "SESSION_FILE_DIR", str(Path(__file__).parent / "flask_session")
+        )
+
+        # Compiled template cache shared by workers and restarts (empty disables it)
+        self.TEMPLATE_CACHE_DIR = os.environ.get(
+            "TEMPLATE_CACHE_DIR", str(Path(__file__).parent / ".jinja_cache")
+        )
+
+        # Rate limiting (shares the session Redis by default so limits hold across workers)
+        default_ratelimit_storage = (
+            self.SESSION_REDIS_URL if self.SESSION_TYPE == "redis" else "memory://"
+        )
+        self.RATELIMIT_STORAGE_URI = os.environ.get(
+            "RATELIMIT_STORAGE_URI", default_ratelimit_storage
+        )
 
         # Logging settings
         self.LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -110,26 +127,33 @@ class Config:
         env_file = Path(__file__).parent / ".env"
 
         separator = "=" * SEPARATOR_WIDTH
-        logger.warning(separator)
-        logger.warning("⚠️  WARNING: No SECRET_KEY found in environment!")
-        logger.warning(separator)
-        logger.warning("A temporary secret key has been generated, but sessions will be")
-        logger.warning("invalidated when the server restarts.")
-        logger.warning("")
-        logger.warning("To fix this, add the following line to your .env file:")
-        logger.warning("")
-        logger.warning("SECRET_KEY=%s", new_secret_key)
-        logger.warning("")
+        lines = [
+            separator,
+            "⚠️  WARNING: No SECRET_KEY found in environment!",
+            separator,
+            "A temporary secret key has been generated, but sessions will be",
+            "invalidated when the server restarts.",
+            "",
+            "To fix this, add the following line to your .env file:",
+            "",
+            f"SECRET_KEY={new_secret_key}",
+            "",
+        ]
 
         if not env_file.exists():
-            logger.warning("Create the file at: %s", env_file)
-            logger.warning("")
-            logger.warning("You can also copy .env.example to .env and update it:")
-            logger.warning("  cp .env.example .env")
+            lines += [
+                f"Create the file at: {env_file}",
+                "",
+                "You can also copy .env.example to .env and update it:",
+                "  cp .env.example .env",
+            ]
         else:
-            logger.warning("Add it to: %s", env_file)
+            lines.append(f"Add it to: {env_file}")
 
-        logger.warning(separator)
+        lines.append(separator)
+
+        # Emit the banner as one record so it is written (and locked) once
+        logger.warning("\n".join(lines))
 
         return new_secret_key
 
@@ -197,12 +221,84 @@ class Config:
             PERMANENT_SESSION_LIFETIME=self.PERMANENT_SESSION_LIFETIME,
         )
 
+    def setup_session_backend(self, app) -> None:
+        """
+        Enable server-side session storage if configured.
+
+        With SESSION_TYPE unset, Flask's signed-cookie sessions are used (serialized
+        with orjson) and the whole test state travels in the cookie on every request.
+        With SESSION_TYPE=redis or SESSION_TYPE=filesystem the cookie only carries a
+        session id and the state lives in Redis or in files under SESSION_FILE_DIR.
+
+        Args:
+            app: Flask application instance
+
+        Raises:
+            ValueError: If SESSION_TYPE is not a supported backend
+        """
+        if not self.SESSION_TYPE:
+            from session_serializer import OrjsonSessionInterface
+
+            app.session_interface = OrjsonSessionInterface()
+            return
+
+        if self.SESSION_TYPE == "redis":
+            # Imported lazily so cookie-session deployments don't need a Redis client
+            import redis
+
+            app.config.update(
+                SESSION_TYPE="redis",
+                SESSION_REDIS=redis.Redis.from_url(self.SESSION_REDIS_URL),
+            )
+        elif self.SESSION_TYPE == "filesystem":
+            from cachelib import FileSystemCache
+
+            app.config.update(
+                SESSION_TYPE="cachelib",
+                SESSION_CACHELIB=FileSystemCache(self.SESSION_FILE_DIR),
+            )
+        else:
+            raise ValueError(f"Unsupported SESSION_TYPE: {self.SESSION_TYPE}")
+
+        from flask_session import Session
+
+        Session(app)
+
+        logger.info("✓ Server-side sessions enabled (%s)", self.SESSION_TYPE)
+
+    def setup_template_cache(self, app) -> None:
+        """
+        Persist compiled Jinja templates to TEMPLATE_CACHE_DIR.
+
+        Each worker process otherwise compiles every template again on first use.
+        Template auto-reload already follows FLASK_DEBUG, so production renders never
+        stat the template files.
+
+        Args:
+            app: Flask application instance
+        """
+        if not self.TEMPLATE_CACHE_DIR:
+            return
+
+        from jinja2 import FileSystemBytecodeCache
+
+        cache_dir = Path(self.TEMPLATE_CACHE_DIR)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("Template cache disabled, cannot create %s: %s", cache_dir, e)
+            return
+
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        logger.info("✓ Template bytecode cache: %s", cache_dir)
+
     def __repr__(self) -> str:
         """String representation of config (hides secret key)."""
         return (
             f"Config("
             f"DEBUG={self.DEBUG}, "
             f"LOG_LEVEL={self.LOG_LEVEL}, "
+            f"SESSION_TYPE={self.SESSION_TYPE or 'cookie'}, "
             f"SECRET_KEY={'***' if self.SECRET_KEY else 'NOT SET'}"
             f")"
         )
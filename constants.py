@@ -19,6 +19,12 @@ TIMER_WARNING_THRESHOLD = 180  # Yellow warning when <= 180 seconds
 # Clock skew detection threshold (in seconds)
 CLOCK_SKEW_LOG_THRESHOLD = 2  # Log warning if skew > 2 seconds
 
+# Question constants
+MAX_OPTIONS_PER_QUESTION = 10  # Matches "maxItems" for options in questions_schema.json
+# Question indices are stored in the session as unsigned 16-bit values, so the
+# bank can hold at most 65536 questions. Matches the root "maxItems" in questions_schema.json
+MAX_QUESTIONS = 65536
+
 # UI constants
 SEPARATOR_WIDTH = 80  # Width of separator lines in console output
 
@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for production deployments.
+
+Usage:
+    gunicorn app:app
+
+Gunicorn picks up this file automatically from the working directory.
+Settings can be tuned with the environment variables below.
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Threaded workers let each process overlap requests that wait on I/O
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", min(multiprocessing.cpu_count(), 4)))
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Load the app (and the question bank) once in the master before forking, so workers
+# share it copy-on-write instead of each parsing and holding their own copy
+preload_app = True
+
+# Keep connections open between a question POST and the next request
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+
+
+def pre_fork(server, worker):
+    """Exclude the preloaded app from garbage collection before forking a worker.
+
+    Collections in a worker would otherwise write to the GC headers of the shared
+    question data and force the kernel to copy those pages into every worker.
+    """
+    gc.freeze()
@@ -5,13 +5,17 @@ This module provides comprehensive validation for quiz questions data,
 ensuring data integrity at load time rather than runtime.
 """
 
-import json
+import functools
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import orjson
 from jsonschema import Draft7Validator
 from jsonschema.exceptions import SchemaError
 
+from constants import MAX_QUESTIONS
+
 
 class QuestionValidationError(Exception):
     """Custom exception for question validation errors."""
@@ -42,12 +46,12 @@ def load_schema(schema_path: Path) -> Dict[str, Any]:
         QuestionValidationError: If schema file is invalid
     """
     try:
-        with open(schema_path, "r", encoding="utf-8") as f:
-            schema: Dict[str, Any] = json.load(f)
+        with open(schema_path, "rb") as f:
+            schema: Dict[str, Any] = orjson.loads(f.read())
         return schema
     except FileNotFoundError as e:
         raise QuestionValidationError(f"Schema file not found: {schema_path}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise QuestionValidationError(f"Invalid JSON in schema file: {e}") from e
 
 
@@ -64,10 +68,38 @@ def validate_questions_against_schema(
     Raises:
         QuestionValidationError: If validation fails
     """
-    try:
-        # Create validator
-        validator = Draft7Validator(schema)
+    _validate_with_validator(questions, Draft7Validator(schema))
+
+
+@functools.lru_cache(maxsize=4)
+def get_schema_validator(schema_path: Path) -> Draft7Validator:
+    """
+    Load a JSON schema file and build its validator once per process.
+
+    Args:
+        schema_path: Path to the schema file
+
+    Returns:
+        Validator for the schema
+
+    Raises:
+        QuestionValidationError: If the schema file is missing or invalid
+    """
+    return Draft7Validator(load_schema(schema_path))
+
 
+def _validate_with_validator(questions: List[Dict[str, Any]], validator: Draft7Validator) -> None:
+    """
+    Validate questions data with a prepared schema validator.
+
+    Args:
+        questions: List of question dictionaries
+        validator: Validator for the questions schema
+
+    Raises:
+        QuestionValidationError: If validation fails
+    """
+    try:
         # Collect all validation errors
         errors = []
         for error in validator.iter_errors(questions):
@@ -82,6 +114,30 @@ def validate_questions_against_schema(
         raise QuestionValidationError(f"Invalid schema: {e}") from e
 
 
+def _check_answer_index(idx: int, question: Dict[str, Any]) -> Optional[str]:
+    """Return an error message if the question's correct_answer_index is out of bounds."""
+    correct_idx = question.get("correct_answer_index")
+    num_options = len(question.get("options", []))
+
+    if correct_idx is not None and (correct_idx < 0 or correct_idx >= num_options):
+        return (
+            f"Question {idx}: correct_answer_index ({correct_idx}) is out of bounds "
+            f"(0-{num_options - 1})"
+        )
+    return None
+
+
+def _check_unique_options(idx: int, question: Dict[str, Any]) -> Optional[str]:
+    """Return an error message if the question has duplicate options."""
+    options = question.get("options", [])
+
+    if len(set(options)) < len(options):
+        # One counting pass instead of options.count() per option
+        duplicates = [opt for opt, count in Counter(options).items() if count > 1]
+        return f"Question {idx}: Duplicate options found: {duplicates}"
+    return None
+
+
 def validate_answer_indices(questions: List[Dict[str, Any]]) -> None:
     """
     Validate that correct_answer_index is within bounds of options array.
@@ -97,15 +153,9 @@ def validate_answer_indices(questions: List[Dict[str, Any]]) -> None:
     errors = []
 
     for idx, question in enumerate(questions):
-        correct_idx = question.get("correct_answer_index")
-        options = question.get("options", [])
-        num_options = len(options)
-
-        if correct_idx is not None and (correct_idx < 0 or correct_idx >= num_options):
-            errors.append(
-                f"Question {idx}: correct_answer_index ({correct_idx}) is out of bounds "
-                f"(0-{num_options - 1})"
-            )
+        error = _check_answer_index(idx, question)
+        if error is not None:
+            errors.append(error)
 
     if errors:
         raise QuestionValidationError("Invalid answer indices found", errors=errors)
@@ -124,18 +174,52 @@ def validate_unique_options(questions: List[Dict[str, Any]]) -> None:
     errors = []
 
     for idx, question in enumerate(questions):
-        options = question.get("options", [])
-        unique_options = set(options)
-
-        if len(unique_options) < len(options):
-            duplicates = [opt for opt in options if options.count(opt) > 1]
-            unique_duplicates = list(set(duplicates))
-            errors.append(f"Question {idx}: Duplicate options found: {unique_duplicates}")
+        error = _check_unique_options(idx, question)
+        if error is not None:
+            errors.append(error)
 
     if errors:
         raise QuestionValidationError("Duplicate options found in questions", errors=errors)
 
 
+def validate_question_semantics(questions: List[Dict[str, Any]]) -> None:
+    """
+    Run all semantic validations in a single pass over the questions.
+
+    Equivalent to validate_answer_indices followed by validate_unique_options,
+    except that errors of both kinds are reported together.
+
+    Args:
+        questions: List of question dictionaries
+
+    Raises:
+        QuestionValidationError: If any semantic check fails
+    """
+    index_errors: List[str] = []
+    duplicate_errors: List[str] = []
+
+    for idx, question in enumerate(questions):
+        index_error = _check_answer_index(idx, question)
+        if index_error is not None:
+            index_errors.append(index_error)
+
+        duplicate_error = _check_unique_options(idx, question)
+        if duplicate_error is not None:
+            duplicate_errors.append(duplicate_error)
+
+    if index_errors and duplicate_errors:
+        raise QuestionValidationError(
+            "Invalid answer indices and duplicate options found",
+            errors=index_errors + duplicate_errors,
+        )
+    if index_errors:
+        raise QuestionValidationError("Invalid answer indices found", errors=index_errors)
+    if duplicate_errors:
+        raise QuestionValidationError(
+            "Duplicate options found in questions", errors=duplicate_errors
+        )
+
+
 def validate_questions_data(
     questions: List[Dict[str, Any]],
     schema_path: Path,
@@ -152,14 +236,19 @@ def validate_questions_data(
     Raises:
         QuestionValidationError: If validation fails
     """
-    # Load and validate against schema
-    schema = load_schema(schema_path)
-    validate_questions_against_schema(questions, schema)
+    # Checked up front so an oversized bank gets one clear error instead of a
+    # schema report, and never reaches the 16-bit session index storage
+    if len(questions) > MAX_QUESTIONS:
+        raise QuestionValidationError(
+            f"Too many questions: {len(questions)} (at most {MAX_QUESTIONS} are supported)"
+        )
+
+    # Validate against the schema (loaded and compiled once per schema file)
+    _validate_with_validator(questions, get_schema_validator(schema_path))
 
     if strict:
         # Additional semantic validations
-        validate_answer_indices(questions)
-        validate_unique_options(questions)
+        validate_question_semantics(questions)
 
 
 def validate_questions_file(
@@ -181,13 +270,13 @@ def validate_questions_file(
     Raises:
         QuestionValidationError: If file loading or validation fails
     """
-    # Load questions file
+    # Load questions file (orjson parses raw bytes several times faster than json)
     try:
-        with open(questions_path, "r", encoding="utf-8") as f:
-            questions: List[Dict[str, Any]] = json.load(f)
+        with open(questions_path, "rb") as f:
+            questions: List[Dict[str, Any]] = orjson.loads(f.read())
     except FileNotFoundError as e:
         raise QuestionValidationError(f"Questions file not found: {questions_path}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise QuestionValidationError(f"Invalid JSON in questions file: {e}") from e
 
     # Validate questions data
@@ -0,0 +1,119 @@
+"""
+On-disk cache of validated questions data.
+
+Parsing and schema-validating the questions file is the slowest part of startup.
+This module stores the validated result in a pickle sidecar file that is reused
+for as long as the source files are unchanged.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload layout changes
+CACHE_VERSION = 1
+
+CacheKey = Tuple[Any, ...]
+
+
+def get_cache_path(questions_path: Path) -> Path:
+    """
+    Get the cache file path for a questions file.
+
+    Args:
+        questions_path: Path to the questions JSON file
+
+    Returns:
+        Path of the pickle sidecar next to the questions file
+    """
+    return questions_path.with_name(questions_path.name + ".pkl")
+
+
+def build_cache_key(source_paths: Sequence[Path]) -> CacheKey:
+    """
+    Build a cache key from the modification time and size of the source files.
+
+    Args:
+        source_paths: Files the cached data is derived from
+
+    Returns:
+        Cache key tuple
+    """
+    key: List[Any] = [CACHE_VERSION]
+    for path in source_paths:
+        stat = path.stat()
+        key.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def load_cached_questions(
+    cache_path: Path, source_paths: Sequence[Path]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load questions from the cache if it is still valid.
+
+    Args:
+        cache_path: Path to the cache file
+        source_paths: Files the cached data is derived from
+
+    Returns:
+        Cached questions, or None if the cache is missing, stale or unreadable
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, questions = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        ValueError,
+        TypeError,
+        AttributeError,
+        ImportError,
+    ) as e:
+        # AttributeError/ImportError: the pickle refers to a class that was moved or renamed
+        logger.warning("Ignoring unreadable questions cache %s: %s", cache_path, e)
+        return None
+
+    if cached_key != build_cache_key(source_paths) or not isinstance(questions, list):
+        return None
+
+    return questions
+
+
+def save_questions_cache(
+    cache_path: Path, source_paths: Sequence[Path], questions: List[Dict[str, Any]]
+) -> None:
+    """
+    Write validated questions to the cache.
+
+    The file is written to a temporary name and moved into place so concurrent
+    readers never see a partial cache. Failures (e.g. a read-only deployment) are
+    logged and otherwise ignored.
+
+    Args:
+        cache_path: Path to the cache file
+        source_paths: Files the cached data is derived from
+        questions: Validated questions to cache
+    """
+    payload = (build_cache_key(source_paths), questions)
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning("Could not write questions cache %s: %s", cache_path, e)
@@ -6,19 +6,10 @@ echo   Running All Tests
 echo ========================================
 echo.
 
-REM Track failures
-set FAILED=0
-
-REM Run each test file
-for %%f in (tests\test_*.py) do (
-    echo Running %%~nxf...
-    python %%f
-    if %ERRORLEVEL% NEQ 0 (
-        set FAILED=1
-        echo ❌ %%~nxf failed!
-    )
-    echo.
-)
+REM Run the whole suite in one pytest session
+python -m pytest -q
+set FAILED=%ERRORLEVEL%
+echo.
 
 echo ========================================
 if %FAILED% EQU 0 (
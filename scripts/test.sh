@@ -6,21 +6,10 @@ echo "  Running All Tests"
 echo "========================================"
 echo ""
 
-# Track failures
-FAILED=0
-
-# Run each test file
-for test_file in tests/test_*.py; do
-    if [ -f "$test_file" ]; then
-        echo "Running $(basename "$test_file")..."
-        python "$test_file"
-        if [ $? -ne 0 ]; then
-            FAILED=1
-            echo "❌ $(basename "$test_file") failed!"
-        fi
-        echo ""
-    fi
-done
+# Run the whole suite in one pytest session
+python -m pytest -q
+FAILED=$?
+echo ""
 
 echo "========================================"
 if [ $FAILED -eq 0 ]; then
@@ -4,108 +4,186 @@ Business logic services for quiz application.
 This module contains all business logic separated from route handlers.
 """
 
+import functools
 import random
-from typing import Any, Dict, List, Optional, Tuple
+import secrets
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from constants import MAX_OPTIONS_PER_QUESTION
+from validators import (
+    ValidationError,
+    validate_answer_index,
+    validate_correct_answer_index,
+    validate_question_data,
+    validate_question_index_in_range,
+    validate_wrong_answer_entry,
+)
+
+# Radio button values are option indices written as plain digits
+ANSWER_VALUES: Dict[str, int] = {str(i): i for i in range(MAX_OPTIONS_PER_QUESTION)}
+
+
+def freeze_question(question: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Make a loaded question read-only.
 
-from validators import ValidationError
+    Questions are shared by all requests once loaded, so they are wrapped in a
+    read-only mapping (with options stored as a tuple) instead of being copied
+    defensively wherever they are used. Category names are interned so every
+    question in a category shares one string.
 
+    Args:
+        question: Question dictionary as loaded from the data file
 
-def filter_questions_by_categories(
-    all_questions: List[Dict[str, Any]], selected_categories: List[str]
-) -> List[Dict[str, Any]]:
+    Returns:
+        Read-only view of the question
+    """
+    frozen = {**question, "options": tuple(question["options"])}
+    category = question.get("category")
+    if isinstance(category, str):
+        frozen["category"] = sys.intern(category)
+    return MappingProxyType(frozen)
+
+
+def build_category_index(all_questions: Sequence[Mapping[str, Any]]) -> Dict[str, List[int]]:
     """
-    Filter questions by selected categories.
+    Group question indices by category.
 
     Args:
         all_questions: List of all available questions
-        selected_categories: List of category names to filter by
 
     Returns:
-        List of questions matching the selected categories
+        Dictionary mapping each category name to the indices of its questions
     """
-    return [q for q in all_questions if q.get("category") in selected_categories]
+    category_index: Dict[str, List[int]] = {}
+    for idx, question in enumerate(all_questions):
+        category = question.get("category")
+        if category is not None:
+            category_index.setdefault(category, []).append(idx)
+    return category_index
 
 
-def select_random_questions(
-    questions: List[Dict[str, Any]], num_questions: int
-) -> List[Dict[str, Any]]:
+def get_indices_for_categories(
+    category_index: Dict[str, List[int]], selected_categories: List[str]
+) -> List[int]:
     """
-    Randomly select questions from a list.
+    Collect question indices belonging to the selected categories.
 
     Args:
-        questions: List of questions to select from
-        num_questions: Number of questions to select
+        category_index: Mapping of category name to question indices
+        selected_categories: List of category names to include
 
     Returns:
-        List of randomly selected questions
+        List of question indices, without duplicates
     """
-    return random.sample(questions, num_questions)
+    # dict.fromkeys drops repeated categories while preserving order
+    return [
+        idx
+        for category in dict.fromkeys(selected_categories)
+        for idx in category_index.get(category, [])
+    ]
 
 
-def create_shuffle_mappings(
-    selected_indices: List[int], questions: List[Dict[str, Any]]
-) -> Dict[int, Dict[str, Any]]:
+def count_questions_for_categories(
+    category_index: Dict[str, List[int]], selected_categories: List[str]
+) -> int:
     """
-    Create shuffle mappings for answer options.
+    Count the questions in the selected categories without collecting their indices.
 
     Args:
-        selected_indices: List of question indices
-        questions: List of all questions
+        category_index: Mapping of category name to question indices
+        selected_categories: List of category names to include
 
     Returns:
-        Dictionary mapping question indices to shuffle information
+        Number of available questions
     """
-    shuffle_mappings: Dict[int, Dict[str, Any]] = {}
+    return sum(
+        len(category_index.get(category, ())) for category in dict.fromkeys(selected_categories)
+    )
 
-    for idx in selected_indices:
-        question = questions[idx]
-        num_options = len(question["options"])
 
-        # Create a shuffled order
-        shuffled_indices = list(range(num_options))
-        random.shuffle(shuffled_indices)
+def select_random_indices(indices: List[int], num_questions: int) -> List[int]:
+    """
+    Randomly select question indices from a list.
 
-        # Find where the correct answer ended up
-        correct_answer_index = question["correct_answer_index"]
-        new_correct_index = shuffled_indices.index(correct_answer_index)
+    Args:
+        indices: List of question indices to select from
+        num_questions: Number of indices to select
 
-        shuffle_mappings[idx] = {
-            "order": shuffled_indices,
-            "correct_index": new_correct_index,
-        }
+    Returns:
+        List of randomly selected question indices
+    """
+    return random.sample(indices, num_questions)
+
+
+def create_shuffle_seed() -> int:
+    """
+    Create a random seed for shuffling answer options in a test.
+
+    Returns:
+        64-bit random seed
+    """
+    return secrets.randbits(64)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_shuffle_order(question_index: int, num_options: int, shuffle_seed: int) -> Tuple[int, ...]:
+    """
+    Derive the shuffled option order for a question from the test's seed.
+
+    The same seed and question index always produce the same order, so only the
+    seed needs to be stored in the session. Each question's order is needed again
+    when its answer is submitted and on review, so recent orders are memoised.
+
+    Args:
+        question_index: Index of the question in the original questions list
+        num_options: Number of answer options
+        shuffle_seed: The test's shuffle seed
 
-    return shuffle_mappings
+    Returns:
+        Tuple of original option indices in display order
+    """
+    order = list(range(num_options))
+    random.Random(shuffle_seed ^ question_index).shuffle(order)
+    return tuple(order)
 
 
 def apply_shuffle_mapping(
-    question: Dict[str, Any],
+    question: Mapping[str, Any],
     question_index: int,
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
-) -> Dict[str, Any]:
+    shuffle_seed: Optional[int],
+) -> Mapping[str, Any]:
     """
-    Apply shuffle mapping to a question's options if shuffling is enabled.
+    Apply the shuffled option order to a question if shuffling is enabled.
 
     Args:
-        question: Dictionary containing question data (will be modified in place)
+        question: Dictionary containing question data (not modified)
         question_index: Index of the question in the original questions list
-        shuffle_mappings: Dictionary mapping question indices to shuffle data
+        shuffle_seed: The test's shuffle seed, or None if shuffling is disabled
 
     Returns:
-        The modified question dictionary
+        The question itself if shuffling is disabled, otherwise a new dictionary
+        with reordered options and the matching correct answer index. Callers must
+        treat the result as read-only.
     """
-    if shuffle_mappings and question_index in shuffle_mappings:
-        mapping = shuffle_mappings[question_index]
-        shuffled_order = mapping["order"]
-        original_options = question["options"]
-        question["options"] = [original_options[i] for i in shuffled_order]
-        question["correct_answer_index"] = mapping["correct_index"]
-    return question
+    if shuffle_seed is None:
+        return question
+
+    original_options = question["options"]
+    shuffled_order = get_shuffle_order(question_index, len(original_options), shuffle_seed)
+    return {
+        **question,
+        "options": [original_options[i] for i in shuffled_order],
+        "correct_answer_index": shuffled_order.index(question["correct_answer_index"]),
+    }
 
 
 def get_correct_answer_index(
     question_index: int,
-    questions: List[Dict[str, Any]],
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
+    questions: Sequence[Mapping[str, Any]],
+    shuffle_seed: Optional[int],
 ) -> int:
     """
     Get the correct answer index, accounting for shuffling.
@@ -113,113 +191,97 @@ def get_correct_answer_index(
     Args:
         question_index: Index of the question
         questions: List of all questions
-        shuffle_mappings: Shuffle mappings if shuffling is enabled
+        shuffle_seed: The test's shuffle seed, or None if shuffling is disabled
 
     Returns:
         The correct answer index
     """
-    if shuffle_mappings and question_index in shuffle_mappings:
-        correct_idx: int = shuffle_mappings[question_index]["correct_index"]
+    question = questions[question_index]
+    correct_idx: int = question["correct_answer_index"]
+    if shuffle_seed is None:
         return correct_idx
-    correct_idx_direct: int = questions[question_index]["correct_answer_index"]
-    return correct_idx_direct
+    return get_shuffle_order(question_index, len(question["options"]), shuffle_seed).index(
+        correct_idx
+    )
 
 
 def process_answer(
     user_answer_int: Optional[int],
     correct_answer_index: int,
-    current_question_index: int,
     q_index: int,
-) -> Tuple[bool, Optional[Dict[str, Any]]]:
+) -> Tuple[bool, Optional[List[Optional[int]]]]:
     """
     Process a user's answer and determine if it's correct.
 
+    Wrong answers are recorded as compact [position, user_answer] pairs; the question
+    index and question number are recovered from the position when reviewing.
+
     Args:
         user_answer_int: User's answer index (None if unanswered/invalid)
         correct_answer_index: The correct answer index
-        current_question_index: Index of current question in global list
-        q_index: Sequential question number
+        q_index: Position of the question in the test
 
     Returns:
-        Tuple of (is_correct, wrong_answer_data or None)
+        Tuple of (is_correct, wrong answer entry or None)
     """
-    if user_answer_int is None:
-        # Unanswered or invalid answer
-        return False, {
-            "question_index": current_question_index,
-            "user_answer": None,
-            "question_number": q_index + 1,
-        }
-
     if user_answer_int == correct_answer_index:
         # Correct answer
         return True, None
 
-    # Wrong answer
-    return False, {
-        "question_index": current_question_index,
-        "user_answer": user_answer_int,
-        "question_number": q_index + 1,
-    }
+    # Wrong, unanswered or invalid answer
+    return False, [q_index, user_answer_int]
 
 
 def build_review_data(
-    wrong_answers: List[Dict[str, Any]],
-    questions: List[Dict[str, Any]],
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
+    wrong_answers: List[Any],
+    selected_indices: List[int],
+    questions: Sequence[Mapping[str, Any]],
+    shuffle_seed: Optional[int],
 ) -> List[Dict[str, Any]]:
     """
     Build review data for wrong answers.
 
     Args:
-        wrong_answers: List of wrong answer entries from session
+        wrong_answers: List of [position, user_answer] entries from session
+        selected_indices: List of selected question indices for the test
         questions: List of all questions
-        shuffle_mappings: Shuffle mappings if enabled
+        shuffle_seed: The test's shuffle seed, or None if shuffling is disabled
 
     Returns:
         List of review data dictionaries
     """
-    from validators import (
-        validate_answer_index,
-        validate_correct_answer_index,
-        validate_question_data,
-        validate_wrong_answer_entry,
-    )
-
     review_data: List[Dict[str, Any]] = []
+    num_selected = len(selected_indices)
+    num_questions = len(questions)
 
     for wrong in wrong_answers:
-        question_index = validate_wrong_answer_entry(wrong, len(questions))
-        if question_index is None:
+        position = validate_wrong_answer_entry(wrong, num_selected)
+        if position is None:
             continue
 
-        question = questions[question_index].copy()
-
-        # Apply shuffling if it was enabled
-        question = apply_shuffle_mapping(question, question_index, shuffle_mappings)
+        question_index = selected_indices[position]
+        if question_index >= num_questions:
+            continue
 
-        # Validate question has required fields
+        # Shuffling only reorders options, so validate the loaded question before it
+        original_question = questions[question_index]
+        num_options = len(original_question.get("options", ()))
         try:
-            validate_question_data(question)
+            validate_question_data(original_question)
+            validate_correct_answer_index(original_question["correct_answer_index"], num_options)
         except ValidationError:
             continue
 
+        # Apply shuffling if it was enabled
+        question = apply_shuffle_mapping(original_question, question_index, shuffle_seed)
         correct_answer_index = question["correct_answer_index"]
-        num_options = len(question.get("options", []))
-
-        # Validate correct answer index
-        try:
-            validate_correct_answer_index(correct_answer_index, num_options)
-        except ValidationError:
-            continue
 
         # Validate and sanitize user answer
-        user_answer = wrong.get("user_answer")
-        user_answer = validate_answer_index(user_answer, num_options)
+        user_answer = validate_answer_index(wrong[1], num_options)
 
         review_data.append(
             {
-                "question_number": wrong.get("question_number", 0),
+                "question_number": position + 1,
                 "question": question,
                 "user_answer": user_answer,
                 "correct_answer_index": correct_answer_index,
@@ -242,42 +304,38 @@ def calculate_score_percentage(score: int, total: int) -> int:
     """
     if total <= 0:
         return 0
-    return int((score / total) * 100)
+    # Integer arithmetic avoids float rounding (29 / 50 * 100 == 57.99999999999999)
+    return (score * 100) // total
 
 
 def prepare_question_for_display(
     q_index: int,
     selected_indices: List[int],
-    questions: List[Dict[str, Any]],
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
-) -> Dict[str, Any]:
+    questions: Sequence[Mapping[str, Any]],
+    shuffle_seed: Optional[int],
+) -> Mapping[str, Any]:
     """
-    Prepare a question for display by retrieving and applying shuffle mappings.
+    Prepare a question for display by retrieving it and shuffling its options.
 
     Args:
         q_index: Current question index in the test sequence
         selected_indices: List of selected question indices
         questions: List of all questions
-        shuffle_mappings: Shuffle mappings if enabled
+        shuffle_seed: The test's shuffle seed, or None if shuffling is disabled
 
     Returns:
-        Dictionary containing the prepared question data
+        Dictionary containing the prepared question data (read-only)
 
     Raises:
         ValidationError: If question index is invalid
     """
-    from validators import validate_question_index_in_range
-
     current_question_index = selected_indices[q_index]
     validate_question_index_in_range(current_question_index, len(questions))
 
-    current_question = questions[current_question_index].copy()
-    current_question = apply_shuffle_mapping(
-        current_question, current_question_index, shuffle_mappings
+    return apply_shuffle_mapping(
+        questions[current_question_index], current_question_index, shuffle_seed
     )
 
-    return current_question
-
 
 def validate_and_parse_user_answer(answer_str: Optional[str], num_options: int) -> Optional[int]:
     """
@@ -290,53 +348,47 @@ def validate_and_parse_user_answer(answer_str: Optional[str], num_options: int)
     Returns:
         Validated answer index or None if invalid/missing
     """
-    from validators import validate_answer_index
-
-    if not answer_str:
+    # A table lookup replaces int() parsing; anything that is not a plain option index
+    # (signs, whitespace, non-ASCII digits, over-long input) simply misses the table
+    user_answer_int = ANSWER_VALUES.get(answer_str) if isinstance(answer_str, str) else None
+    if user_answer_int is None or user_answer_int >= num_options:
         return None
 
-    try:
-        user_answer_int = int(answer_str)
-        return validate_answer_index(user_answer_int, num_options)
-    except (ValueError, TypeError):
-        return None
+    return user_answer_int
 
 
 def handle_answer_submission(
     user_answer_int: Optional[int],
-    current_question_index: int,
     q_index: int,
-    questions: List[Dict[str, Any]],
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]],
-    current_question: Dict[str, Any],
-) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    question_index: int,
+    questions: Sequence[Mapping[str, Any]],
+    shuffle_seed: Optional[int],
+) -> Tuple[bool, Optional[List[Optional[int]]]]:
     """
     Handle the complete answer submission workflow.
 
+    The answer is checked against the correct index as it was displayed, without
+    building the display version of the question.
+
     Args:
         user_answer_int: User's validated answer index
-        current_question_index: Index of current question
-        q_index: Sequential question number
+        q_index: Position of the question in the test
+        question_index: Index of the question in the original questions list
         questions: List of all questions
-        shuffle_mappings: Shuffle mappings if enabled
-        current_question: The current question dict
+        shuffle_seed: The test's shuffle seed, or None if shuffling is disabled
 
     Returns:
-        Tuple of (is_correct, wrong_answer_data or None)
+        Tuple of (is_correct, wrong answer entry or None)
 
     Raises:
         ValidationError: If validation fails
     """
-    from validators import validate_correct_answer_index
-
-    # Get correct answer index
-    correct_answer_index = get_correct_answer_index(
-        current_question_index, questions, shuffle_mappings
-    )
+    # Validate the stored correct answer before mapping it through the shuffle
+    question = questions[question_index]
+    num_options = len(question.get("options", ()))
+    validate_correct_answer_index(question["correct_answer_index"], num_options)
 
-    # Validate correct answer index
-    num_options = len(current_question.get("options", []))
-    validate_correct_answer_index(correct_answer_index, num_options)
+    correct_answer_index = get_correct_answer_index(question_index, questions, shuffle_seed)
 
     # Process the answer
-    return process_answer(user_answer_int, correct_answer_index, current_question_index, q_index)
+    return process_answer(user_answer_int, correct_answer_index, q_index)
@@ -5,12 +5,51 @@ This module contains session-related helper functions.
 """
 
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from typing import Any, List, Optional, Tuple
 
-from flask import session
+from flask import g, has_app_context, session
 
 from constants import CLOCK_SKEW_TOLERANCE_SECONDS, DEFAULT_TIME_LIMIT_SECONDS, SECONDS_PER_MINUTE
 
+# Selected question indices are stored as unsigned 16-bit values (2 bytes each);
+# question banks are capped at MAX_QUESTIONS at load time so every index fits
+INDEX_TYPECODE = "H"
+
+
+def pack_indices(indices: List[int]) -> bytes:
+    """
+    Pack question indices into a compact byte string for session storage.
+
+    Args:
+        indices: List of question indices
+
+    Returns:
+        Packed indices
+    """
+    return array(INDEX_TYPECODE, indices).tobytes()
+
+
+def unpack_indices(packed: Any) -> Optional[List[int]]:
+    """
+    Unpack question indices stored with pack_indices.
+
+    Args:
+        packed: Packed indices from session
+
+    Returns:
+        List of question indices or None if the data is malformed
+    """
+    if not isinstance(packed, bytes):
+        return None
+
+    indices = array(INDEX_TYPECODE)
+    try:
+        indices.frombytes(packed)
+    except ValueError:
+        return None
+    return indices.tolist()
+
 
 def validate_time_remaining() -> Tuple[bool, int]:
     """
@@ -25,7 +64,7 @@ def validate_time_remaining() -> Tuple[bool, int]:
     if start_time is None:
         return False, 0
 
-    elapsed_time = time.time() - start_time
+    elapsed_time = get_server_timestamp() - start_time
     remaining_time = int(time_limit - elapsed_time)
 
     # Time has expired
@@ -39,10 +78,19 @@ def get_server_timestamp() -> float:
     """
     Get the current server timestamp.
 
+    The clock is read once per request, so the timer check and the timestamp sent
+    to the page agree with each other.
+
     Returns:
         Current server time as Unix timestamp (seconds since epoch)
     """
-    return time.time()
+    if not has_app_context():
+        return time.time()
+
+    if "server_timestamp" not in g:
+        g.server_timestamp = time.time()
+    server_timestamp: float = g.server_timestamp
+    return server_timestamp
 
 
 def validate_client_timestamp(
@@ -71,7 +119,7 @@ def validate_client_timestamp(
 
 def initialize_test_session(
     selected_indices: List[int],
-    shuffle_mappings: Dict[int, Dict[str, Any]],
+    shuffle_seed: Optional[int],
     time_limit_minutes: int,
     shuffle_answers: bool,
 ) -> None:
@@ -80,34 +128,44 @@ def initialize_test_session(
 
     Args:
         selected_indices: List of selected question indices
-        shuffle_mappings: Shuffle mappings for answers
+        shuffle_seed: Seed for shuffling answers, or None if shuffling is disabled
         time_limit_minutes: Time limit in minutes
         shuffle_answers: Whether answers are shuffled
     """
-    session["selected_question_indices"] = selected_indices
+    session["selected_question_indices"] = pack_indices(selected_indices)
     session["current_question_index"] = 0
     session["score"] = 0
     session["wrong_answers"] = []
     session["time_limit"] = time_limit_minutes * SECONDS_PER_MINUTE  # Convert to seconds
-    session["start_time"] = time.time()
-    session["shuffle_mappings"] = shuffle_mappings
+    session["start_time"] = get_server_timestamp()
+    session["shuffle_seed"] = shuffle_seed
     session["shuffle_answers"] = shuffle_answers
 
 
-def get_current_question_data() -> (
-    Tuple[Optional[int], Optional[List[int]], Optional[Dict[int, Dict[str, Any]]]]
-):
+def get_shuffle_seed() -> Optional[int]:
+    """
+    Get the answer shuffle seed from session.
+
+    Returns:
+        Shuffle seed, or None if shuffling is disabled or the value is malformed
+    """
+    shuffle_seed = session.get("shuffle_seed")
+    if not isinstance(shuffle_seed, int) or isinstance(shuffle_seed, bool):
+        return None
+    return shuffle_seed
+
+
+def get_current_question_data() -> Tuple[Optional[int], Optional[List[int]], Optional[int]]:
     """
     Get current question data from session.
 
     Returns:
-        Tuple of (current_index, selected_indices, shuffle_mappings)
+        Tuple of (current_index, selected_indices, shuffle_seed)
     """
     q_index: Optional[int] = session.get("current_question_index")
-    selected_indices: Optional[List[int]] = session.get("selected_question_indices")
-    shuffle_mappings: Optional[Dict[int, Dict[str, Any]]] = session.get("shuffle_mappings")
+    selected_indices = unpack_indices(session.get("selected_question_indices"))
 
-    return q_index, selected_indices, shuffle_mappings
+    return q_index, selected_indices, get_shuffle_seed()
 
 
 def increment_question_index() -> None:
@@ -121,16 +179,41 @@ def add_to_score() -> None:
     session["score"] = session.get("score", 0) + 1
 
 
-def add_wrong_answer(wrong_answer_data: Dict[str, Any]) -> None:
+def _append_wrong_answer(wrong_answer: List[Optional[int]]) -> None:
+    """Append to the session's wrong answers in place and flag the session as changed."""
+    wrong_answers = session.get("wrong_answers")
+    if wrong_answers is None:
+        session["wrong_answers"] = [wrong_answer]
+        return
+
+    wrong_answers.append(wrong_answer)
+    session.modified = True
+
+
+def add_wrong_answer(wrong_answer: List[Optional[int]]) -> None:
     """
     Add a wrong answer to the session.
 
     Args:
-        wrong_answer_data: Dictionary containing wrong answer information
+        wrong_answer: [position, user_answer] pair for the missed question
     """
-    wrong_answers = session.get("wrong_answers", [])
-    wrong_answers.append(wrong_answer_data)
-    session["wrong_answers"] = wrong_answers
+    _append_wrong_answer(wrong_answer)
+
+
+def record_answer(is_correct: bool, wrong_answer: Optional[List[Optional[int]]]) -> None:
+    """
+    Record an answer and advance to the next question in a single session update.
+
+    Args:
+        is_correct: Whether the answer was correct
+        wrong_answer: [position, user_answer] pair, or None if nothing should be recorded
+    """
+    session["current_question_index"] = session.get("current_question_index", 0) + 1
+
+    if is_correct:
+        session["score"] = session.get("score", 0) + 1
+    elif wrong_answer is not None:
+        _append_wrong_answer(wrong_answer)
 
 
 def get_score_data() -> Tuple[Any, Any, Any]:
@@ -141,26 +224,26 @@ def get_score_data() -> Tuple[Any, Any, Any]:
         Tuple of (score, selected_indices, wrong_answers)
     """
     score = session.get("score", 0)
-    selected_indices = session.get("selected_question_indices", [])
+    selected_indices = unpack_indices(session.get("selected_question_indices")) or []
     wrong_answers = session.get("wrong_answers", [])
 
     return score, selected_indices, wrong_answers
 
 
-def get_review_data() -> Tuple[Any, Any]:
+def get_review_data() -> Tuple[Any, List[int], Optional[int]]:
     """
     Get review-related data from session.
 
     Returns:
-        Tuple of (wrong_answers, shuffle_mappings)
+        Tuple of (wrong_answers, selected_indices, shuffle_seed)
     """
     wrong_answers = session.get("wrong_answers", [])
-    shuffle_mappings = session.get("shuffle_mappings")
+    selected_indices = unpack_indices(session.get("selected_question_indices")) or []
 
-    return wrong_answers, shuffle_mappings
+    return wrong_answers, selected_indices, get_shuffle_seed()
 
 
-def sanitize_score(score: int, total: int) -> int:
+def sanitize_score(score: Any, total: int) -> int:
     """
     Sanitize and validate score value.
 
@@ -171,10 +254,8 @@ def sanitize_score(score: int, total: int) -> int:
     Returns:
         Validated score value
     """
-    if not isinstance(score, int) or score < 0:
+    if not isinstance(score, int):
         return 0
 
-    if score > total:
-        return total
-
-    return score
+    # Clamp into [0, total]
+    return max(0, min(score, total))
@@ -0,0 +1,61 @@
+"""
+Fast session serialization for cookie-based sessions.
+
+This module provides an orjson-backed drop-in replacement for Flask's tagged JSON
+session serializer.
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSessionInterface
+
+
+class OrjsonTaggedJSONSerializer(TaggedJSONSerializer):
+    """
+    Tagged JSON serializer that encodes and decodes with orjson.
+
+    Tagging is inherited from Flask, so non-JSON types such as bytes and tuples
+    round-trip exactly as they do with the default serializer.
+    """
+
+    __slots__ = ()
+
+    def dumps(self, value: Any) -> str:
+        """
+        Tag the value and dump it to a compact JSON string.
+
+        Args:
+            value: Session data
+
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(self.tag(value), option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, value: str | bytes) -> Any:
+        """
+        Load a JSON string and restore tagged objects.
+
+        Args:
+            value: JSON string
+
+        Returns:
+            Session data
+        """
+        return self._untag_scan(orjson.loads(value))
+
+    def _untag_scan(self, value: Any) -> Any:
+        """Untag nested objects innermost first, like json.loads with an object_hook."""
+        if isinstance(value, dict):
+            return self.untag({key: self._untag_scan(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return [self._untag_scan(item) for item in value]
+        return value
+
+
+class OrjsonSessionInterface(SecureCookieSessionInterface):
+    """Signed-cookie session interface using the orjson serializer."""
+
+    serializer = OrjsonTaggedJSONSerializer()
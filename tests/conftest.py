@@ -0,0 +1,57 @@
+"""
+Shared pytest fixtures.
+"""
+
+from types import MappingProxyType
+
+import pytest
+
+import session_helpers
+
+
+class FakeSession(dict):
+    """Minimal stand-in for flask.session backed by a plain dict."""
+
+    modified = False
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    """Give every test an empty session in place of Flask's request-bound one."""
+    session = FakeSession()
+    monkeypatch.setattr(session_helpers, "session", session)
+    return session
+
+
+@pytest.fixture(scope="module")
+def sample_questions():
+    """Read-only questions shaped like the ones the app loads."""
+    return tuple(
+        MappingProxyType(question)
+        for question in [
+            {
+                "question": "Q1",
+                "category": "Math",
+                "options": ("A", "B", "C"),
+                "correct_answer_index": 1,
+            },
+            {
+                "question": "Q2",
+                "category": "Science",
+                "options": ("X", "Y", "Z"),
+                "correct_answer_index": 0,
+            },
+            {
+                "question": "Q3",
+                "category": "Math",
+                "options": ("A", "B", "C", "D"),
+                "correct_answer_index": 2,
+            },
+            {
+                "question": "Q4",
+                "category": "History",
+                "options": ("P", "Q"),
+                "correct_answer_index": 0,
+            },
+        ]
+    )
@@ -0,0 +1,57 @@
+"""
+Tests for the error handlers in app.py.
+"""
+
+import importlib
+import logging
+
+import pytest
+
+from validators import ValidationError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client for the app, without writing to the log file."""
+    monkeypatch.setenv("LOG_TO_FILE", "false")
+    return app_module().app.test_client()
+
+
+def app_module():
+    """Import the app module (once; later calls return the same module)."""
+    return importlib.import_module("app")
+
+
+def test_method_not_allowed_sets_allow_header(client):
+    """Test a 405 response renders the error page and lists the allowed methods."""
+    response = client.put("/")
+
+    assert response.status_code == 405
+    assert response.content_type.startswith("text/html")
+    assert "GET" in response.headers["Allow"]
+    assert "PUT" not in response.headers["Allow"]
+
+
+@pytest.mark.parametrize(
+    "error,level",
+    [
+        (ValidationError("Invalid test session"), logging.WARNING),
+        (ValidationError("Invalid question configuration", code=500), logging.ERROR),
+    ],
+)
+def test_validation_error_log_level(client, monkeypatch, caplog, error, level):
+    """Test client errors are logged as warnings and question data errors as errors."""
+
+    def raise_error(*_args):
+        raise error
+
+    module = app_module()
+    monkeypatch.setattr(module, "validate_time_remaining", lambda: (True, 60))
+    monkeypatch.setattr(module, "validate_session_question_index", raise_error)
+
+    with caplog.at_level(logging.WARNING, logger="app"):
+        response = client.get("/question")
+
+    assert response.status_code == error.code
+    records = [r for r in caplog.records if r.getMessage().startswith("Validation error")]
+    assert [r.levelno for r in records] == [level]
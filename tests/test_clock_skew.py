@@ -2,63 +2,48 @@
 Test clock skew detection functionality.
 """
 
-import sys
-import time
-from pathlib import Path
+import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import session_helpers
+from session_helpers import get_server_timestamp, validate_client_timestamp
 
-from session_helpers import get_server_timestamp, validate_client_timestamp  # noqa: E402
+# Server clock reading for tests that pin time.time
+FIXED_NOW = 1_700_000_000.0
 
 
-def test_valid_timestamp():
-    """Test that a current timestamp is valid."""
-    current_time = time.time()
-    assert validate_client_timestamp(current_time) is True
-    print("✓ Valid timestamp test passed")
+@pytest.fixture
+def fixed_clock(monkeypatch):
+    """Pin the server clock so skew checks do not depend on wall time."""
+    monkeypatch.setattr(session_helpers.time, "time", lambda: FIXED_NOW)
 
 
-def test_future_timestamp_within_tolerance():
-    """Test that a slightly future timestamp (within tolerance) is valid."""
-    future_time = time.time() + 3  # 3 seconds in the future
-    assert validate_client_timestamp(future_time) is True
-    print("✓ Future timestamp within tolerance test passed")
+@pytest.mark.parametrize(
+    "offset,tolerance,expected",
+    [
+        (0, 5, True),  # Current timestamp
+        (3, 5, True),  # Slightly in the future, within tolerance
+        (-4, 5, True),  # Slightly in the past, within tolerance
+        (10, 5, False),  # Future, beyond tolerance
+        (-10, 5, False),  # Past, beyond tolerance
+        (-8, 10, True),  # Custom tolerance accepts the skew
+        (-8, 5, False),  # Default-sized tolerance rejects the same skew
+    ],
+)
+def test_clock_skew(fixed_clock, offset, tolerance, expected):
+    """Test timestamps are accepted only within the tolerance."""
+    client_timestamp = FIXED_NOW + offset
+    assert validate_client_timestamp(client_timestamp, tolerance_seconds=tolerance) is expected
 
 
-def test_past_timestamp_within_tolerance():
-    """Test that a slightly past timestamp (within tolerance) is valid."""
-    past_time = time.time() - 4  # 4 seconds in the past
-    assert validate_client_timestamp(past_time) is True
-    print("✓ Past timestamp within tolerance test passed")
-
-
-def test_future_timestamp_beyond_tolerance():
-    """Test that a future timestamp beyond tolerance is invalid."""
-    future_time = time.time() + 10  # 10 seconds in the future (beyond 5s tolerance)
-    assert validate_client_timestamp(future_time) is False
-    print("✓ Future timestamp beyond tolerance test passed")
-
-
-def test_past_timestamp_beyond_tolerance():
-    """Test that a past timestamp beyond tolerance is invalid."""
-    past_time = time.time() - 10  # 10 seconds in the past (beyond 5s tolerance)
-    assert validate_client_timestamp(past_time) is False
-    print("✓ Past timestamp beyond tolerance test passed")
+def test_default_tolerance(fixed_clock):
+    """Test the default tolerance allows a few seconds of skew."""
+    assert validate_client_timestamp(FIXED_NOW + 3) is True
+    assert validate_client_timestamp(FIXED_NOW - 10) is False
 
 
 def test_none_timestamp():
     """Test that None timestamp is invalid."""
     assert validate_client_timestamp(None) is False
-    print("✓ None timestamp test passed")
-
-
-def test_custom_tolerance():
-    """Test custom tolerance parameter."""
-    past_time = time.time() - 8  # 8 seconds in the past
-    assert validate_client_timestamp(past_time, tolerance_seconds=10) is True
-    assert validate_client_timestamp(past_time, tolerance_seconds=5) is False
-    print("✓ Custom tolerance test passed")
 
 
 def test_server_timestamp():
@@ -66,19 +51,3 @@ def test_server_timestamp():
     timestamp = get_server_timestamp()
     assert isinstance(timestamp, float)
     assert timestamp > 0
-    print("✓ Server timestamp test passed")
-
-
-if __name__ == "__main__":
-    print("Running clock skew detection tests...\n")
-
-    test_valid_timestamp()
-    test_future_timestamp_within_tolerance()
-    test_past_timestamp_within_tolerance()
-    test_future_timestamp_beyond_tolerance()
-    test_past_timestamp_beyond_tolerance()
-    test_none_timestamp()
-    test_custom_tolerance()
-    test_server_timestamp()
-
-    print("\n✓ All clock skew detection tests passed!")
@@ -0,0 +1,75 @@
+"""
+Tests for questions_cache.py module.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from questions_cache import get_cache_path, load_cached_questions, save_questions_cache
+
+SAMPLE_QUESTIONS = [
+    {"question": "Q1", "options": ["A", "B"], "correct_answer_index": 0, "category": "Python"},
+]
+
+
+def make_sources(tmp_dir):
+    """Create a questions file and a schema file in a temporary directory."""
+    questions_file = Path(tmp_dir) / "questions.json"
+    schema_file = Path(tmp_dir) / "questions_schema.json"
+    questions_file.write_text("[]", encoding="utf-8")
+    schema_file.write_text("{}", encoding="utf-8")
+    return questions_file, [questions_file, schema_file]
+
+
+def test_round_trip(tmp_path):
+    """Test that saved questions are loaded back while sources are unchanged."""
+    questions_file, sources = make_sources(tmp_path)
+    cache_file = get_cache_path(questions_file)
+    assert cache_file.name == "questions.json.pkl"
+
+    # Missing cache returns None
+    assert load_cached_questions(cache_file, sources) is None
+
+    save_questions_cache(cache_file, sources, SAMPLE_QUESTIONS)
+    assert load_cached_questions(cache_file, sources) == SAMPLE_QUESTIONS
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_invalidation(tmp_path):
+    """Test that changing a source file or corrupting the cache invalidates it."""
+    questions_file, sources = make_sources(tmp_path)
+    cache_file = get_cache_path(questions_file)
+    save_questions_cache(cache_file, sources, SAMPLE_QUESTIONS)
+
+    # Schema change must invalidate the cache too
+    stat = sources[1].stat()
+    os.utime(sources[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_cached_questions(cache_file, sources) is None
+
+    cache_file.write_bytes(b"not a pickle")
+    assert load_cached_questions(cache_file, sources) is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"cnonexistent_module\nThing\n.",  # Module no longer exists
+        b"cquestions_cache\nRemovedClass\n.",  # Class was renamed
+    ],
+)
+def test_stale_class_reference(tmp_path, payload):
+    """Test that a cache referring to a moved or renamed class is ignored."""
+    questions_file, sources = make_sources(tmp_path)
+    cache_file = get_cache_path(questions_file)
+    cache_file.write_bytes(payload)
+    assert load_cached_questions(cache_file, sources) is None
+
+
+def test_unwritable_cache(tmp_path):
+    """Test that failing to write the cache does not raise."""
+    questions_file, sources = make_sources(tmp_path)
+    cache_file = tmp_path / "missing" / "questions.json.pkl"
+    save_questions_cache(cache_file, sources, SAMPLE_QUESTIONS)
+    assert not cache_file.exists()
@@ -2,348 +2,282 @@
 Tests for services.py module.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from services import (  # noqa: E402
+from services import (
     apply_shuffle_mapping,
+    build_category_index,
     build_review_data,
     calculate_score_percentage,
-    create_shuffle_mappings,
-    filter_questions_by_categories,
+    count_questions_for_categories,
+    create_shuffle_seed,
+    freeze_question,
     get_correct_answer_index,
+    get_indices_for_categories,
+    get_shuffle_order,
+    handle_answer_submission,
     prepare_question_for_display,
     process_answer,
-    select_random_questions,
+    select_random_indices,
     validate_and_parse_user_answer,
 )
-from validators import ValidationError  # noqa: E402
+from validators import ValidationError
+
+
+def test_freeze_question():
+    """Test making loaded questions read-only."""
+    question = {"question": "Q1", "options": ["A", "B"], "correct_answer_index": 1}
+    frozen = freeze_question(question)
+
+    assert frozen["question"] == "Q1"
+    assert frozen["options"] == ("A", "B")
+    assert frozen.get("code_snippet") is None
 
+    with pytest.raises(TypeError):
+        frozen["question"] = "Changed"
 
-def test_filter_questions_by_categories():
-    """Test filtering questions by categories."""
-    print("\n" + "=" * 80)
-    print("TEST: Filter questions by categories")
-    print("=" * 80)
+    # Equal category names end up as one shared string
+    first = freeze_question({"options": ["A"], "category": "".join(["Ma", "th"])})
+    second = freeze_question({"options": ["A"], "category": "".join(["Ma", "th"])})
+    assert first["category"] is second["category"]
 
+    shuffled = apply_shuffle_mapping(frozen, 0, 12345)
+    assert sorted(shuffled["options"]) == ["A", "B"]
+    assert shuffled["options"][shuffled["correct_answer_index"]] == "B"
+
+
+def test_build_category_index():
+    """Test grouping question indices by category."""
     questions = [
         {"question": "Q1", "category": "Math"},
         {"question": "Q2", "category": "Science"},
         {"question": "Q3", "category": "Math"},
-        {"question": "Q4", "category": "History"},
+        {"question": "Q4"},
     ]
 
-    # Test single category
-    result = filter_questions_by_categories(questions, ["Math"])
-    assert len(result) == 2
-    assert all(q["category"] == "Math" for q in result)
-    print("✓ Single category filter passed")
+    index = build_category_index(questions)
+    assert index == {"Math": [0, 2], "Science": [1]}
+
+
+def test_get_indices_for_categories():
+    """Test collecting question indices for selected categories."""
+    index = {"Math": [0, 2], "Science": [1], "History": [3]}
+
+    assert get_indices_for_categories(index, ["Math"]) == [0, 2]
+
+    assert sorted(get_indices_for_categories(index, ["Math", "Science"])) == [0, 1, 2]
+
+    assert get_indices_for_categories(index, ["Math", "Math"]) == [0, 2]
+
+    assert get_indices_for_categories(index, ["Geography"]) == []
+
+
+def test_count_questions_for_categories():
+    """Test counting questions for selected categories."""
+    index = {"Math": [0, 2], "Science": [1], "History": [3]}
 
-    # Test multiple categories
-    result = filter_questions_by_categories(questions, ["Math", "Science"])
+    assert count_questions_for_categories(index, ["Math", "Science"]) == 3
+
+    assert count_questions_for_categories(index, ["Math", "Math"]) == 2
+
+    assert count_questions_for_categories(index, ["Geography"]) == 0
+
+
+def test_select_random_indices():
+    """Test random index selection."""
+    indices = [3, 5, 8, 13, 21]
+
+    result = select_random_indices(indices, 3)
     assert len(result) == 3
-    print("✓ Multiple categories filter passed")
+    assert len(set(result)) == 3
+    assert all(idx in indices for idx in result)
 
-    # Test no matching categories
-    result = filter_questions_by_categories(questions, ["Geography"])
-    assert len(result) == 0
-    print("✓ Empty category filter passed")
+    result = select_random_indices(indices, 5)
+    assert sorted(result) == indices
 
 
-def test_select_random_questions():
-    """Test random question selection."""
-    print("\n" + "=" * 80)
-    print("TEST: Select random questions")
-    print("=" * 80)
+def test_get_shuffle_order():
+    """Test deriving shuffle orders from a seed."""
+    seed = create_shuffle_seed()
+    assert isinstance(seed, int) and 0 <= seed < 2**64
 
-    questions = [{"question": f"Q{i}", "category": "Test"} for i in range(10)]
+    order = get_shuffle_order(3, 4, seed)
+    assert sorted(order) == [0, 1, 2, 3]
 
-    # Test selecting subset
-    result = select_random_questions(questions, 5)
-    assert len(result) == 5
-    assert all(q in questions for q in result)
-    print("✓ Random selection of 5 questions passed")
+    assert get_shuffle_order(3, 4, seed) == order
 
-    # Test selecting all
-    result = select_random_questions(questions, 10)
-    assert len(result) == 10
-    print("✓ Selection of all questions passed")
+    assert isinstance(order, tuple)
 
+    orders = {get_shuffle_order(i, 4, seed) for i in range(50)}
+    assert len(orders) > 1
 
-def test_create_shuffle_mappings():
-    """Test creation of shuffle mappings."""
-    print("\n" + "=" * 80)
-    print("TEST: Create shuffle mappings")
-    print("=" * 80)
 
-    questions = [
-        {
-            "question": "Q1",
-            "options": ["A", "B", "C", "D"],
-            "correct_answer_index": 2,
-        },
-        {
-            "question": "Q2",
-            "options": ["X", "Y", "Z"],
-            "correct_answer_index": 0,
-        },
-    ]
+def test_apply_shuffle_mapping(sample_questions):
+    """Test applying the shuffled order to questions."""
+    question = sample_questions[2]
 
-    selected_indices = [0, 1]
-    mappings = create_shuffle_mappings(selected_indices, questions)
-
-    # Check mappings exist
-    assert 0 in mappings
-    assert 1 in mappings
-    print("✓ Mappings created for all questions")
-
-    # Check structure
-    assert "order" in mappings[0]
-    assert "correct_index" in mappings[0]
-    assert len(mappings[0]["order"]) == 4
-    print("✓ Mapping structure is correct")
-
-    # Verify correct answer index is mapped correctly
-    original_correct = questions[0]["correct_answer_index"]
-    shuffled_order = mappings[0]["order"]
-    new_correct = mappings[0]["correct_index"]
-    assert shuffled_order[new_correct] == original_correct
-    print("✓ Correct answer index properly mapped")
-
-
-def test_apply_shuffle_mapping():
-    """Test applying shuffle mapping to questions."""
-    print("\n" + "=" * 80)
-    print("TEST: Apply shuffle mapping")
-    print("=" * 80)
-
-    question = {
-        "question": "Test question",
-        "options": ["A", "B", "C", "D"],
-        "correct_answer_index": 2,
-    }
-
-    # Test without shuffle mappings
-    result = apply_shuffle_mapping(question.copy(), 0, None)
-    assert result["options"] == ["A", "B", "C", "D"]
+    # Test without shuffling
+    result = apply_shuffle_mapping(question, 0, None)
+    assert result is question
+    assert result["options"] == ("A", "B", "C", "D")
     assert result["correct_answer_index"] == 2
-    print("✓ No shuffle mapping applied correctly")
 
-    # Test with shuffle mappings
-    mappings = {
-        0: {
-            "order": [3, 1, 0, 2],  # Specific shuffle order
-            "correct_index": 3,
-        }
-    }
-    result = apply_shuffle_mapping(question.copy(), 0, mappings)
-    assert result["options"] == ["D", "B", "A", "C"]
-    assert result["correct_answer_index"] == 3
-    print("✓ Shuffle mapping applied correctly")
+    # Test with a seed
+    seed = 12345
+    order = get_shuffle_order(0, 4, seed)
+    result = apply_shuffle_mapping(question, 0, seed)
+    assert result is not question
+    assert result["options"] == [question["options"][i] for i in order]
+    assert result["options"][result["correct_answer_index"]] == "C"
+
+    assert question["options"] == ("A", "B", "C", "D")
+    assert question["correct_answer_index"] == 2
 
 
 def test_get_correct_answer_index():
     """Test getting correct answer index with and without shuffling."""
-    print("\n" + "=" * 80)
-    print("TEST: Get correct answer index")
-    print("=" * 80)
-
     questions = [
-        {"correct_answer_index": 2},
-        {"correct_answer_index": 0},
+        {"options": ["A", "B", "C", "D"], "correct_answer_index": 2},
+        {"options": ["X", "Y"], "correct_answer_index": 0},
     ]
 
     # Without shuffle
     result = get_correct_answer_index(0, questions, None)
     assert result == 2
-    print("✓ Correct index without shuffle")
 
     # With shuffle
-    mappings = {0: {"correct_index": 3}}
-    result = get_correct_answer_index(0, questions, mappings)
-    assert result == 3
-    print("✓ Correct index with shuffle")
+    seed = 12345
+    result = get_correct_answer_index(0, questions, seed)
+    assert get_shuffle_order(0, 4, seed)[result] == 2
+
+
+@pytest.mark.parametrize(
+    "user_answer,correct_index,position,expected",
+    [
+        (2, 2, 0, (True, None)),  # Correct answer
+        (1, 2, 0, (False, [0, 1])),  # Wrong answer
+        (None, 2, 3, (False, [3, None])),  # Unanswered
+    ],
+)
+def test_process_answer(user_answer, correct_index, position, expected):
+    """Test answer processing logic."""
+    assert process_answer(user_answer, correct_index, position) == expected
 
 
-def test_process_answer():
-    """Test answer processing logic."""
-    print("\n" + "=" * 80)
-    print("TEST: Process answer")
-    print("=" * 80)
+def test_handle_answer_submission():
+    """Test answer submission against the question as displayed."""
+    questions = [
+        {"question": "Q1", "options": ["A", "B", "C"], "correct_answer_index": 1},
+    ]
 
-    # Test correct answer
-    is_correct, wrong_data = process_answer(2, 2, 5, 0)
+    is_correct, wrong_data = handle_answer_submission(1, 2, 0, questions, None)
     assert is_correct is True
     assert wrong_data is None
-    print("✓ Correct answer processed")
 
-    # Test wrong answer
-    is_correct, wrong_data = process_answer(1, 2, 5, 0)
-    assert is_correct is False
-    assert wrong_data is not None
-    assert wrong_data["question_index"] == 5
-    assert wrong_data["user_answer"] == 1
-    assert wrong_data["question_number"] == 1
-    print("✓ Wrong answer processed")
-
-    # Test unanswered (None)
-    is_correct, wrong_data = process_answer(None, 2, 5, 0)
+    is_correct, wrong_data = handle_answer_submission(0, 2, 0, questions, None)
     assert is_correct is False
-    assert wrong_data is not None
-    assert wrong_data["user_answer"] is None
-    print("✓ Unanswered question processed")
+    assert wrong_data == [2, 0]
 
+    # With shuffling the displayed position of the correct option is expected
+    seed = 12345
+    displayed = prepare_question_for_display(0, [0], questions, seed)
+    shuffled_correct = displayed["correct_answer_index"]
+    is_correct, wrong_data = handle_answer_submission(shuffled_correct, 0, 0, questions, seed)
+    assert is_correct is True
 
-def test_calculate_score_percentage():
+    broken = [{"question": "Q", "options": ["A", "B"], "correct_answer_index": 5}]
+    with pytest.raises(ValidationError):
+        handle_answer_submission(0, 0, 0, broken, None)
+
+
+@pytest.mark.parametrize(
+    "correct,total,expected",
+    [
+        (8, 10, 80),
+        (10, 10, 100),
+        (0, 10, 0),
+        (3, 4, 75),
+        (5, 0, 0),  # Edge case: divide by zero
+        (29, 50, 58),  # Float division would round these down by one
+        (57, 100, 57),
+    ],
+)
+def test_calculate_score_percentage(correct, total, expected):
     """Test score percentage calculation."""
-    print("\n" + "=" * 80)
-    print("TEST: Calculate score percentage")
-    print("=" * 80)
-
-    assert calculate_score_percentage(8, 10) == 80
-    assert calculate_score_percentage(10, 10) == 100
-    assert calculate_score_percentage(0, 10) == 0
-    assert calculate_score_percentage(3, 4) == 75
-    assert calculate_score_percentage(5, 0) == 0  # Edge case: divide by zero
-    print("✓ All percentage calculations passed")
-
-
-def test_validate_and_parse_user_answer():
+    assert calculate_score_percentage(correct, total) == expected
+
+
+@pytest.mark.parametrize(
+    "user_answer,num_options,expected",
+    [
+        ("0", 4, 0),
+        ("2", 4, 2),
+        ("9", 10, 9),  # Every option index the schema allows can be answered
+        ("", 4, None),
+        (None, 4, None),
+        ("abc", 4, None),
+        ("5", 4, None),  # Out of range
+        ("-1", 4, None),  # Negative
+        ("²", 4, None),  # Non-ASCII digit
+        ("9" * 5000, 4, None),  # Over-long
+        (" 1", 4, None),  # Whitespace
+        ("01", 4, None),  # Not a radio value
+    ],
+)
+def test_validate_and_parse_user_answer(user_answer, num_options, expected):
     """Test user answer validation and parsing."""
-    print("\n" + "=" * 80)
-    print("TEST: Validate and parse user answer")
-    print("=" * 80)
-
-    # Valid answers
-    assert validate_and_parse_user_answer("0", 4) == 0
-    assert validate_and_parse_user_answer("2", 4) == 2
-    print("✓ Valid answers parsed correctly")
-
-    # Invalid answers
-    assert validate_and_parse_user_answer("", 4) is None
-    assert validate_and_parse_user_answer(None, 4) is None
-    assert validate_and_parse_user_answer("abc", 4) is None
-    assert validate_and_parse_user_answer("5", 4) is None  # Out of range
-    assert validate_and_parse_user_answer("-1", 4) is None  # Negative
-    print("✓ Invalid answers handled correctly")
+    assert validate_and_parse_user_answer(user_answer, num_options) == expected
 
 
-def test_prepare_question_for_display():
+def test_prepare_question_for_display(sample_questions):
     """Test question preparation for display."""
-    print("\n" + "=" * 80)
-    print("TEST: Prepare question for display")
-    print("=" * 80)
-
-    questions = [
-        {
-            "question": "Q1",
-            "options": ["A", "B", "C"],
-            "correct_answer_index": 1,
-        },
-        {
-            "question": "Q2",
-            "options": ["X", "Y"],
-            "correct_answer_index": 0,
-        },
-    ]
-
     selected_indices = [1, 0]
 
     # Test without shuffle
-    result = prepare_question_for_display(0, selected_indices, questions, None)
+    result = prepare_question_for_display(0, selected_indices, sample_questions, None)
     assert result["question"] == "Q2"
-    assert result["options"] == ["X", "Y"]
-    print("✓ Question prepared without shuffle")
+    assert result["options"] == ("X", "Y", "Z")
 
     # Test with shuffle
-    mappings = {1: {"order": [1, 0], "correct_index": 1}}
-    result = prepare_question_for_display(0, selected_indices, questions, mappings)
+    seed = 12345
+    result = prepare_question_for_display(0, selected_indices, sample_questions, seed)
     assert result["question"] == "Q2"
-    assert result["options"] == ["Y", "X"]
-    print("✓ Question prepared with shuffle")
+    assert result["options"] == [("X", "Y", "Z")[i] for i in get_shuffle_order(1, 3, seed)]
+    assert result["options"][result["correct_answer_index"]] == "X"
+    assert sample_questions[1]["options"] == ("X", "Y", "Z")  # Original left untouched
 
     # Test invalid index
-    try:
-        prepare_question_for_display(10, selected_indices, questions, None)
-        raise AssertionError("Should have raised ValidationError")
-    except (ValidationError, IndexError):
-        print("✓ Invalid index raises error")
+    with pytest.raises((ValidationError, IndexError)):
+        prepare_question_for_display(10, selected_indices, sample_questions, None)
 
 
-def test_build_review_data():
+def test_build_review_data(sample_questions):
     """Test building review data for wrong answers."""
-    print("\n" + "=" * 80)
-    print("TEST: Build review data")
-    print("=" * 80)
-
-    questions = [
-        {
-            "question": "Q1",
-            "options": ["A", "B", "C"],
-            "correct_answer_index": 1,
-        },
-        {
-            "question": "Q2",
-            "options": ["X", "Y", "Z"],
-            "correct_answer_index": 0,
-        },
-    ]
-
-    wrong_answers = [
-        {
-            "question_index": 0,
-            "user_answer": 2,
-            "question_number": 1,
-        },
-        {
-            "question_index": 1,
-            "user_answer": 1,
-            "question_number": 2,
-        },
-    ]
+    # The test asked Q2 first, then Q1; both were answered wrong
+    selected_indices = [1, 0]
+    wrong_answers = [[0, 1], [1, 2]]
 
     # Test without shuffle
-    review_data = build_review_data(wrong_answers, questions, None)
+    review_data = build_review_data(wrong_answers, selected_indices, sample_questions, None)
     assert len(review_data) == 2
-    assert review_data[0]["question"]["question"] == "Q1"
-    assert review_data[0]["user_answer"] == 2
-    assert review_data[0]["correct_answer_index"] == 1
-    print("✓ Review data built without shuffle")
+    assert review_data[1]["question_number"] == 2
+    assert review_data[1]["question"]["question"] == "Q1"
+    assert review_data[1]["user_answer"] == 2
+    assert review_data[1]["correct_answer_index"] == 1
 
     # Test with invalid entries (should be skipped)
-    invalid_wrong = [
-        {"question_index": 999, "user_answer": 0, "question_number": 1},
-        {"question_index": 0, "user_answer": 1, "question_number": 2},
-    ]
-    review_data = build_review_data(invalid_wrong, questions, None)
+    invalid_wrong = [[999, 0], {"question_index": 0}, [1, 1]]
+    review_data = build_review_data(invalid_wrong, selected_indices, sample_questions, None)
     assert len(review_data) == 1  # Only valid entry
-    print("✓ Invalid review entries skipped")
-
-
-def main():
-    """Run all tests."""
-    print("=" * 80)
-    print("Services Module Test Suite")
-    print("=" * 80)
-
-    test_filter_questions_by_categories()
-    test_select_random_questions()
-    test_create_shuffle_mappings()
-    test_apply_shuffle_mapping()
-    test_get_correct_answer_index()
-    test_process_answer()
-    test_calculate_score_percentage()
-    test_validate_and_parse_user_answer()
-    test_prepare_question_for_display()
-    test_build_review_data()
-
-    print("\n" + "=" * 80)
-    print("✓ All services tests passed!")
-    print("=" * 80)
-
 
-if __name__ == "__main__":
-    main()
+    # Questions missing required data are skipped, with or without shuffling
+    broken_questions = [*sample_questions, {"question": "Q5", "options": ["A", "B"]}]
+    broken_index = [len(sample_questions)]
+    broken_wrong = [[0, 0]]
+    assert build_review_data(broken_wrong, broken_index, broken_questions, None) == []
+    assert build_review_data(broken_wrong, broken_index, broken_questions, 12345) == []
+
+    # With shuffling the correct index follows the shuffled options
+    review_data = build_review_data(wrong_answers, [0, 1], sample_questions, 12345)
+    first = review_data[0]
+    assert first["question"]["options"][first["correct_answer_index"]] == "B"
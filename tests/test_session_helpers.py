@@ -1,47 +1,17 @@
 """
 Tests for session_helpers.py module.
 
-Note: These tests mock the Flask session object for testing purposes.
+Note: These tests run against the fake session from the fake_session fixture in conftest.py.
 """
 
-import sys
-import time
-from pathlib import Path
-from unittest.mock import MagicMock
+import itertools
+from types import SimpleNamespace
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-# Mock Flask session before importing session_helpers
-sys.modules["flask"] = MagicMock()
-mock_session = {}
-
-
-def mock_session_get(key, default=None):
-    """Mock session.get() method."""
-    return mock_session.get(key, default)
-
-
-def mock_session_setitem(key, value):
-    """Mock session[key] = value."""
-    mock_session[key] = value
-
-
-def mock_session_getitem(key):
-    """Mock session[key]."""
-    if key not in mock_session:
-        raise KeyError(key)
-    return mock_session[key]
-
-
-# Configure mock session
-mock_session_obj = MagicMock()
-mock_session_obj.get = mock_session_get
-mock_session_obj.__setitem__ = lambda self, k, v: mock_session_setitem(k, v)
-mock_session_obj.__getitem__ = lambda self, k: mock_session_getitem(k)
-sys.modules["flask"].session = mock_session_obj
-
-from session_helpers import (  # noqa: E402
+import session_helpers
+from constants import MAX_QUESTIONS
+from session_helpers import (
     add_to_score,
     add_wrong_answer,
     get_current_question_data,
@@ -50,315 +20,280 @@ from session_helpers import (  # noqa: E402
     get_server_timestamp,
     increment_question_index,
     initialize_test_session,
+    pack_indices,
+    record_answer,
     sanitize_score,
+    unpack_indices,
     validate_client_timestamp,
     validate_time_remaining,
 )
 
 
-def reset_session():
-    """Reset mock session between tests."""
-    global mock_session
-    mock_session = {}
+class FakeAppGlobals(SimpleNamespace):
+    """Minimal stand-in for flask.g that supports membership tests."""
+
+    def __contains__(self, name):
+        return name in self.__dict__
 
 
-def test_get_server_timestamp():
+# Clock reading used by tests that monkeypatch time.time
+FIXED_NOW = 1_700_000_000.0
+
+
+def test_get_server_timestamp(monkeypatch):
     """Test getting server timestamp."""
-    print("\n" + "=" * 80)
-    print("TEST: Get server timestamp")
-    print("=" * 80)
+    clock = itertools.count(FIXED_NOW, 0.001)
+    monkeypatch.setattr(session_helpers.time, "time", lambda: next(clock))
 
     timestamp1 = get_server_timestamp()
-    time.sleep(0.1)
     timestamp2 = get_server_timestamp()
 
     assert isinstance(timestamp1, float)
     assert isinstance(timestamp2, float)
     assert timestamp2 > timestamp1
     assert timestamp1 > 0
-    print("✓ Server timestamp working correctly")
 
+    # Within a request the clock is read only once
+    monkeypatch.setattr(session_helpers, "g", FakeAppGlobals())
+    monkeypatch.setattr(session_helpers, "has_app_context", lambda: True)
+    timestamp1 = get_server_timestamp()
+    assert get_server_timestamp() == timestamp1
 
-def test_validate_client_timestamp():
-    """Test client timestamp validation for clock skew."""
-    print("\n" + "=" * 80)
-    print("TEST: Validate client timestamp")
-    print("=" * 80)
 
-    current_time = time.time()
+def test_validate_client_timestamp(monkeypatch):
+    """Test client timestamp validation for clock skew."""
+    current_time = FIXED_NOW
+    monkeypatch.setattr(session_helpers.time, "time", lambda: current_time)
 
     # Valid timestamps within tolerance
     assert validate_client_timestamp(current_time) is True
     assert validate_client_timestamp(current_time + 2) is True
     assert validate_client_timestamp(current_time - 3) is True
-    print("✓ Timestamps within tolerance accepted")
 
     # Invalid timestamps beyond tolerance (default is 5 seconds)
     assert validate_client_timestamp(current_time + 10) is False
     assert validate_client_timestamp(current_time - 10) is False
-    print("✓ Timestamps beyond tolerance rejected")
 
     # Custom tolerance
     past_time = current_time - 8
     assert validate_client_timestamp(past_time, tolerance_seconds=10) is True
     assert validate_client_timestamp(past_time, tolerance_seconds=5) is False
-    print("✓ Custom tolerance works")
 
     # None handling
     assert validate_client_timestamp(None) is False
-    print("✓ None timestamp rejected")
 
 
-def test_initialize_test_session():
-    """Test session initialization."""
-    print("\n" + "=" * 80)
-    print("TEST: Initialize test session")
-    print("=" * 80)
+def test_pack_indices():
+    """Test packing question indices for session storage."""
+    indices = [0, 3, 5, 352]
+    packed = pack_indices(indices)
+    assert isinstance(packed, bytes)
+    assert len(packed) == 2 * len(indices)
+    assert unpack_indices(packed) == indices
+
+    assert unpack_indices(pack_indices([])) == []
+
+    # The last index of the largest supported question bank still fits
+    assert unpack_indices(pack_indices([MAX_QUESTIONS - 1])) == [MAX_QUESTIONS - 1]
+    with pytest.raises(OverflowError):
+        pack_indices([MAX_QUESTIONS])
+
+    # Malformed session data
+    assert unpack_indices(None) is None
+    assert unpack_indices([1, 2, 3]) is None
+    assert unpack_indices(b"\x01") is None  # Odd length
 
-    reset_session()
 
+def test_initialize_test_session(fake_session):
+    """Test session initialization."""
     selected_indices = [0, 3, 5, 7]
-    shuffle_mappings = {0: {"order": [1, 0, 2], "correct_index": 1}}
+    shuffle_seed = 12345
     time_limit_minutes = 15
     shuffle_answers = True
 
     initialize_test_session(
         selected_indices,
-        shuffle_mappings,
+        shuffle_seed,
         time_limit_minutes,
         shuffle_answers,
     )
 
     # Check all session values are set correctly
-    assert mock_session["selected_question_indices"] == selected_indices
-    assert mock_session["current_question_index"] == 0
-    assert mock_session["score"] == 0
-    assert mock_session["wrong_answers"] == []
-    assert mock_session["time_limit"] == 15 * 60  # 900 seconds
-    assert mock_session["shuffle_mappings"] == shuffle_mappings
-    assert mock_session["shuffle_answers"] is True
-    assert "start_time" in mock_session
-    assert isinstance(mock_session["start_time"], float)
-    print("✓ Session initialized correctly")
-
-
-def test_get_current_question_data():
+    assert unpack_indices(fake_session["selected_question_indices"]) == selected_indices
+    assert fake_session["current_question_index"] == 0
+    assert fake_session["score"] == 0
+    assert fake_session["wrong_answers"] == []
+    assert fake_session["time_limit"] == 15 * 60  # 900 seconds
+    assert fake_session["shuffle_seed"] == shuffle_seed
+    assert fake_session["shuffle_answers"] is True
+    assert "start_time" in fake_session
+    assert isinstance(fake_session["start_time"], float)
+
+
+def test_get_current_question_data(fake_session):
     """Test getting current question data from session."""
-    print("\n" + "=" * 80)
-    print("TEST: Get current question data")
-    print("=" * 80)
-
-    reset_session()
-    mock_session["current_question_index"] = 3
-    mock_session["selected_question_indices"] = [1, 2, 3, 4]
-    mock_session["shuffle_mappings"] = {1: {"order": [0, 1]}}
+    fake_session["current_question_index"] = 3
+    fake_session["selected_question_indices"] = pack_indices([1, 2, 3, 4])
+    fake_session["shuffle_seed"] = 12345
 
-    q_index, selected, mappings = get_current_question_data()
+    q_index, selected, shuffle_seed = get_current_question_data()
 
     assert q_index == 3
     assert selected == [1, 2, 3, 4]
-    assert mappings == {1: {"order": [0, 1]}}
-    print("✓ Current question data retrieved correctly")
+    assert shuffle_seed == 12345
 
+    fake_session["shuffle_seed"] = "12345"
+    assert get_current_question_data()[2] is None
 
-def test_increment_question_index():
-    """Test incrementing question index."""
-    print("\n" + "=" * 80)
-    print("TEST: Increment question index")
-    print("=" * 80)
 
-    reset_session()
-    mock_session["current_question_index"] = 0
+def test_increment_question_index(fake_session):
+    """Test incrementing question index."""
+    fake_session["current_question_index"] = 0
 
     increment_question_index()
-    assert mock_session["current_question_index"] == 1
+    assert fake_session["current_question_index"] == 1
 
     increment_question_index()
-    assert mock_session["current_question_index"] == 2
+    assert fake_session["current_question_index"] == 2
 
     increment_question_index()
-    assert mock_session["current_question_index"] == 3
-    print("✓ Question index increments correctly")
+    assert fake_session["current_question_index"] == 3
 
     # Test when not set
-    reset_session()
+    fake_session.clear()
     increment_question_index()
-    assert mock_session["current_question_index"] == 1
-    print("✓ Handles missing initial index")
+    assert fake_session["current_question_index"] == 1
 
 
-def test_add_to_score():
+def test_add_to_score(fake_session):
     """Test adding to score."""
-    print("\n" + "=" * 80)
-    print("TEST: Add to score")
-    print("=" * 80)
-
-    reset_session()
-    mock_session["score"] = 0
+    fake_session["score"] = 0
 
     add_to_score()
-    assert mock_session["score"] == 1
+    assert fake_session["score"] == 1
 
     add_to_score()
-    assert mock_session["score"] == 2
+    assert fake_session["score"] == 2
 
     add_to_score()
-    assert mock_session["score"] == 3
-    print("✓ Score increments correctly")
+    assert fake_session["score"] == 3
 
     # Test when not set
-    reset_session()
+    fake_session.clear()
     add_to_score()
-    assert mock_session["score"] == 1
-    print("✓ Handles missing initial score")
+    assert fake_session["score"] == 1
 
 
-def test_add_wrong_answer():
+def test_add_wrong_answer(fake_session):
     """Test adding wrong answers."""
-    print("\n" + "=" * 80)
-    print("TEST: Add wrong answer")
-    print("=" * 80)
+    fake_session["wrong_answers"] = []
 
-    reset_session()
-    mock_session["wrong_answers"] = []
-
-    wrong1 = {"question_index": 0, "user_answer": 2}
+    wrong1 = [0, 2]
     add_wrong_answer(wrong1)
-    assert len(mock_session["wrong_answers"]) == 1
-    assert mock_session["wrong_answers"][0] == wrong1
+    assert len(fake_session["wrong_answers"]) == 1
+    assert fake_session["wrong_answers"][0] == wrong1
 
-    wrong2 = {"question_index": 3, "user_answer": 1}
+    wrong2 = [3, None]
     add_wrong_answer(wrong2)
-    assert len(mock_session["wrong_answers"]) == 2
-    assert mock_session["wrong_answers"][1] == wrong2
-    print("✓ Wrong answers added correctly")
+    assert len(fake_session["wrong_answers"]) == 2
+    assert fake_session["wrong_answers"][1] == wrong2
 
     # Test when not set
-    reset_session()
+    fake_session.clear()
     add_wrong_answer(wrong1)
-    assert len(mock_session["wrong_answers"]) == 1
-    print("✓ Handles missing initial wrong_answers list")
+    assert len(fake_session["wrong_answers"]) == 1
 
 
-def test_get_score_data():
-    """Test getting score data."""
-    print("\n" + "=" * 80)
-    print("TEST: Get score data")
-    print("=" * 80)
+def test_record_answer(fake_session):
+    """Test recording an answer in a single session update."""
+    fake_session["current_question_index"] = 0
+    fake_session["score"] = 0
+    fake_session["wrong_answers"] = []
+
+    record_answer(True, None)
+    assert fake_session["current_question_index"] == 1
+    assert fake_session["score"] == 1
+    assert fake_session["wrong_answers"] == []
+
+    wrong = [4, 1]
+    record_answer(False, wrong)
+    assert fake_session["current_question_index"] == 2
+    assert fake_session["score"] == 1
+    assert fake_session["wrong_answers"] == [wrong]
+
+    record_answer(False, None)
+    assert fake_session["current_question_index"] == 3
+    assert fake_session["wrong_answers"] == [wrong]
 
-    reset_session()
-    mock_session["score"] = 8
-    mock_session["selected_question_indices"] = [0, 1, 2, 3, 4]
-    mock_session["wrong_answers"] = [{"question_index": 2}]
+
+def test_get_score_data(fake_session):
+    """Test getting score data."""
+    fake_session["score"] = 8
+    fake_session["selected_question_indices"] = pack_indices([0, 1, 2, 3, 4])
+    fake_session["wrong_answers"] = [[2, 1]]
 
     score, selected, wrong = get_score_data()
 
     assert score == 8
     assert selected == [0, 1, 2, 3, 4]
-    assert wrong == [{"question_index": 2}]
-    print("✓ Score data retrieved correctly")
+    assert wrong == [[2, 1]]
 
 
-def test_get_review_data():
+def test_get_review_data(fake_session):
     """Test getting review data."""
-    print("\n" + "=" * 80)
-    print("TEST: Get review data")
-    print("=" * 80)
-
-    reset_session()
-    wrong_answers = [{"question_index": 1}, {"question_index": 3}]
-    mappings = {1: {"order": [2, 0, 1]}}
-    mock_session["wrong_answers"] = wrong_answers
-    mock_session["shuffle_mappings"] = mappings
+    wrong_answers = [[1, 0], [3, None]]
+    fake_session["wrong_answers"] = wrong_answers
+    fake_session["selected_question_indices"] = pack_indices([9, 8, 7, 6])
+    fake_session["shuffle_seed"] = 12345
 
-    wrong, shuffle = get_review_data()
+    wrong, selected, shuffle_seed = get_review_data()
 
     assert wrong == wrong_answers
-    assert shuffle == mappings
-    print("✓ Review data retrieved correctly")
-
-
-def test_sanitize_score():
+    assert selected == [9, 8, 7, 6]
+    assert shuffle_seed == 12345
+
+
+@pytest.mark.parametrize(
+    "score,total,expected",
+    [
+        (5, 10, 5),  # Valid scores pass through
+        (0, 10, 0),
+        (10, 10, 10),
+        (-5, 10, 0),  # Invalid scores sanitized to 0
+        ("invalid", 10, 0),
+        (None, 10, 0),
+        (15, 10, 10),  # Excessive scores capped to total
+        (100, 10, 10),
+    ],
+)
+def test_sanitize_score(score, total, expected):
     """Test score sanitization."""
-    print("\n" + "=" * 80)
-    print("TEST: Sanitize score")
-    print("=" * 80)
-
-    # Valid scores
-    assert sanitize_score(5, 10) == 5
-    assert sanitize_score(0, 10) == 0
-    assert sanitize_score(10, 10) == 10
-    print("✓ Valid scores pass through")
-
-    # Invalid scores
-    assert sanitize_score(-5, 10) == 0
-    assert sanitize_score("invalid", 10) == 0
-    assert sanitize_score(None, 10) == 0
-    print("✓ Invalid scores sanitized to 0")
-
-    # Score exceeds total
-    assert sanitize_score(15, 10) == 10
-    assert sanitize_score(100, 10) == 10
-    print("✓ Excessive scores capped to total")
+    assert sanitize_score(score, total) == expected
 
 
-def test_validate_time_remaining():
+def test_validate_time_remaining(monkeypatch, fake_session):
     """Test time remaining validation."""
-    print("\n" + "=" * 80)
-    print("TEST: Validate time remaining")
-    print("=" * 80)
+    monkeypatch.setattr(session_helpers.time, "time", lambda: FIXED_NOW)
 
     # Test with valid time remaining
-    reset_session()
-    mock_session["start_time"] = time.time()
-    mock_session["time_limit"] = 60  # 60 seconds
+    fake_session["start_time"] = FIXED_NOW - 15
+    fake_session["time_limit"] = 60  # 60 seconds
 
     is_valid, remaining = validate_time_remaining()
     assert is_valid is True
-    assert remaining > 0
-    assert remaining <= 60
-    print("✓ Valid time remaining")
+    assert remaining == 45
 
     # Test with expired time
-    reset_session()
-    mock_session["start_time"] = time.time() - 100  # 100 seconds ago
-    mock_session["time_limit"] = 60  # 60 seconds limit
+    fake_session.clear()
+    fake_session["start_time"] = FIXED_NOW - 100  # 100 seconds ago
+    fake_session["time_limit"] = 60  # 60 seconds limit
 
     is_valid, remaining = validate_time_remaining()
     assert is_valid is False
     assert remaining == 0
-    print("✓ Expired time detected")
 
     # Test with missing start_time
-    reset_session()
+    fake_session.clear()
     is_valid, remaining = validate_time_remaining()
     assert is_valid is False
     assert remaining == 0
-    print("✓ Missing start_time handled")
-
-
-def main():
-    """Run all tests."""
-    print("=" * 80)
-    print("Session Helpers Module Test Suite")
-    print("=" * 80)
-
-    test_get_server_timestamp()
-    test_validate_client_timestamp()
-    test_initialize_test_session()
-    test_get_current_question_data()
-    test_increment_question_index()
-    test_add_to_score()
-    test_add_wrong_answer()
-    test_get_score_data()
-    test_get_review_data()
-    test_sanitize_score()
-    test_validate_time_remaining()
-
-    print("\n" + "=" * 80)
-    print("✓ All session helpers tests passed!")
-    print("=" * 80)
-
-
-if __name__ == "__main__":
-    main()
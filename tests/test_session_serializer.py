@@ -0,0 +1,50 @@
+"""
+Tests for session_serializer.py module.
+"""
+
+from flask.json.tag import TaggedJSONSerializer
+
+from session_helpers import pack_indices
+from session_serializer import OrjsonTaggedJSONSerializer
+
+
+def sample_session():
+    """Build session data shaped like a running test."""
+    return {
+        "selected_question_indices": pack_indices([4, 8, 15, 16, 23, 42]),
+        "current_question_index": 2,
+        "score": 1,
+        "wrong_answers": [[1, 3]],  # [position, user_answer] pairs
+        "time_limit": 900,
+        "start_time": 1700000000.25,
+        "shuffle_seed": 2**64 - 1,
+        "shuffle_answers": True,
+    }
+
+
+def test_round_trip():
+    """Test that session data survives a dumps/loads round trip."""
+    serializer = OrjsonTaggedJSONSerializer()
+    data = sample_session()
+
+    # Bytes, lists, floats and 64-bit seeds round-trip
+    restored = serializer.loads(serializer.dumps(data))
+    assert restored["selected_question_indices"] == data["selected_question_indices"]
+    assert restored["wrong_answers"] == [[1, 3]]
+    assert restored["start_time"] == data["start_time"]
+    assert restored["shuffle_seed"] == data["shuffle_seed"]
+
+    # JSON object keys are strings, matching the default serializer
+    assert serializer.loads(serializer.dumps({"a": {4: 1}})) == {"a": {"4": 1}}
+
+    assert serializer.loads(serializer.dumps((1, 2))) == (1, 2)
+
+
+def test_compatible_with_default_serializer():
+    """Test that cookies written by either serializer can be read by the other."""
+    fast = OrjsonTaggedJSONSerializer()
+    default = TaggedJSONSerializer()
+    data = sample_session()
+
+    assert fast.loads(default.dumps(data)) == default.loads(default.dumps(data))
+    assert default.loads(fast.dumps(data)) == fast.loads(fast.dumps(data))
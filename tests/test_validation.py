@@ -1,19 +1,21 @@
-#!/usr/bin/env python3
 """
-Test script to demonstrate validation catching errors.
+Tests that question validation catches malformed data.
 
-This script tests the validation with intentionally malformed data.
+Invalid data is validated in memory; only the valid-data test goes through a file on disk.
 """
 
 import json
-import sys
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from question_validator import QuestionValidationError, validate_questions_file  # noqa: E402
+from constants import MAX_QUESTIONS
+from question_validator import (
+    QuestionValidationError,
+    get_schema_validator,
+    validate_questions_data,
+    validate_questions_file,
+)
 
 # Schema file location
 SCHEMA_FILE = Path(__file__).parent.parent / "data" / "questions_schema.json"
@@ -21,10 +23,6 @@ SCHEMA_FILE = Path(__file__).parent.parent / "data" / "questions_schema.json"
 
 def test_missing_required_field():
     """Test validation catches missing required fields."""
-    print("\n" + "=" * 80)
-    print("TEST 1: Missing required field (explanation)")
-    print("=" * 80)
-
     invalid_data = [
         {
             "question": "What is 2 + 2?",
@@ -35,28 +33,12 @@ def test_missing_required_field():
         }
     ]
 
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(invalid_data, f)
-        temp_file = Path(f.name)
-
-    schema_file = SCHEMA_FILE
-
-    try:
-        validate_questions_file(temp_file, schema_file)
-        print("✗ Validation should have failed!")
-    except QuestionValidationError as e:
-        print("✓ Correctly caught validation error:")
-        print(f"  {e}")
-    finally:
-        temp_file.unlink()
+    with pytest.raises(QuestionValidationError, match="explanation"):
+        validate_questions_data(invalid_data, SCHEMA_FILE)
 
 
 def test_invalid_answer_index():
     """Test validation catches out-of-bounds answer index."""
-    print("\n" + "=" * 80)
-    print("TEST 2: Invalid answer index (out of bounds)")
-    print("=" * 80)
-
     invalid_data = [
         {
             "question": "What is the capital of France?",
@@ -67,28 +49,12 @@ def test_invalid_answer_index():
         }
     ]
 
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(invalid_data, f)
-        temp_file = Path(f.name)
-
-    schema_file = SCHEMA_FILE
-
-    try:
-        validate_questions_file(temp_file, schema_file, strict=True)
-        print("✗ Validation should have failed!")
-    except QuestionValidationError as e:
-        print("✓ Correctly caught validation error:")
-        print(f"  {e}")
-    finally:
-        temp_file.unlink()
+    with pytest.raises(QuestionValidationError, match="correct_answer_index"):
+        validate_questions_data(invalid_data, SCHEMA_FILE, strict=True)
 
 
 def test_duplicate_options():
     """Test validation catches duplicate options."""
-    print("\n" + "=" * 80)
-    print("TEST 3: Duplicate options")
-    print("=" * 80)
-
     invalid_data = [
         {
             "question": "Which is a programming language?",
@@ -99,28 +65,12 @@ def test_duplicate_options():
         }
     ]
 
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(invalid_data, f)
-        temp_file = Path(f.name)
-
-    schema_file = SCHEMA_FILE
-
-    try:
-        validate_questions_file(temp_file, schema_file, strict=True)
-        print("✗ Validation should have failed!")
-    except QuestionValidationError as e:
-        print("✓ Correctly caught validation error:")
-        print(f"  {e}")
-    finally:
-        temp_file.unlink()
+    with pytest.raises(QuestionValidationError, match="Duplicate options"):
+        validate_questions_data(invalid_data, SCHEMA_FILE, strict=True)
 
 
 def test_question_too_short():
     """Test validation catches questions that are too short."""
-    print("\n" + "=" * 80)
-    print("TEST 4: Question text too short")
-    print("=" * 80)
-
     invalid_data = [
         {
             "question": "Hi?",  # Too short (< 10 chars)
@@ -131,28 +81,12 @@ def test_question_too_short():
         }
     ]
 
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(invalid_data, f)
-        temp_file = Path(f.name)
-
-    schema_file = SCHEMA_FILE
+    with pytest.raises(QuestionValidationError, match="too short"):
+        validate_questions_data(invalid_data, SCHEMA_FILE)
 
-    try:
-        validate_questions_file(temp_file, schema_file)
-        print("✗ Validation should have failed!")
-    except QuestionValidationError as e:
-        print("✓ Correctly caught validation error:")
-        print(f"  {e}")
-    finally:
-        temp_file.unlink()
 
-
-def test_valid_data():
+def test_valid_data(tmp_path):
     """Test validation accepts valid data."""
-    print("\n" + "=" * 80)
-    print("TEST 5: Valid question data")
-    print("=" * 80)
-
     valid_data = [
         {
             "question": "What is the result of 5 + 3 in Python?",
@@ -163,39 +97,47 @@ def test_valid_data():
         }
     ]
 
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(valid_data, f)
-        temp_file = Path(f.name)
+    questions_file = tmp_path / "questions.json"
+    questions_file.write_text(json.dumps(valid_data), encoding="utf-8")
+
+    assert validate_questions_file(questions_file, SCHEMA_FILE, strict=True) == valid_data
 
-    schema_file = SCHEMA_FILE
 
-    try:
-        questions = validate_questions_file(temp_file, schema_file, strict=True)
-        print("✓ Validation passed successfully!")
-        print(f"  Loaded {len(questions)} question(s)")
-    except QuestionValidationError as e:
-        print(f"✗ Validation failed unexpectedly: {e}")
-    finally:
-        temp_file.unlink()
+def test_schema_validator_reused():
+    """Test the schema validator is built once per schema file."""
+    validator = get_schema_validator(SCHEMA_FILE)
+    assert get_schema_validator(SCHEMA_FILE) is validator
 
 
-def main():
-    """Run all tests."""
-    print("=" * 80)
-    print("Questions Validation Test Suite")
-    print("=" * 80)
-    print("\nThis script demonstrates how validation catches various data errors.")
+def test_combined_semantic_errors():
+    """Test answer index and duplicate option errors are reported together."""
+    invalid_data = [
+        {
+            "question": "Which keyword defines a function in Python?",
+            "options": ["def", "func", "lambda"],
+            "correct_answer_index": 3,
+            "category": "Python",
+            "explanation": "Functions are defined with the def keyword.",
+        },
+        {
+            "question": "Which language is this quiz about?",
+            "options": ["Python", "Java", "Python"],
+            "correct_answer_index": 0,
+            "category": "Python",
+            "explanation": "The quiz is about Python.",
+        },
+    ]
 
-    test_missing_required_field()
-    test_invalid_answer_index()
-    test_duplicate_options()
-    test_question_too_short()
-    test_valid_data()
+    with pytest.raises(QuestionValidationError) as excinfo:
+        validate_questions_data(invalid_data, SCHEMA_FILE, strict=True)
 
-    print("\n" + "=" * 80)
-    print("All tests completed!")
-    print("=" * 80)
+    errors = excinfo.value.errors
+    assert len(errors) == 2
+    assert errors[0].startswith("Question 0: correct_answer_index")
+    assert errors[1].startswith("Question 1: Duplicate options")
 
 
-if __name__ == "__main__":
-    main()
+def test_too_many_questions():
+    """Test banks larger than the session index storage are rejected at load."""
+    with pytest.raises(QuestionValidationError, match="at most 65536"):
+        validate_questions_data([{}] * (MAX_QUESTIONS + 1), SCHEMA_FILE)
@@ -20,11 +20,6 @@ from question_validator import (
     validate_questions_file,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -110,4 +105,9 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not when imported
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+    )
     sys.exit(main())
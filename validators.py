@@ -4,40 +4,69 @@ Validation functions for quiz application.
 This module contains all input validation logic separated from route handlers.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, FrozenSet, List, Mapping, Optional, Tuple
 
 # Time limit constants
 MAX_TIME_LIMIT_MINUTES = 120
 MIN_TIME_LIMIT_MINUTES = 1
 DEFAULT_TIME_LIMIT_MINUTES = 10
 
+# Time limit error messages, formatted once from the limits above
+TIME_LIMIT_TOO_SHORT_MESSAGE = f"Time limit must be at least {MIN_TIME_LIMIT_MINUTES} minute(s)"
+TIME_LIMIT_TOO_LONG_MESSAGE = f"Time limit cannot exceed {MAX_TIME_LIMIT_MINUTES} minutes"
+
+# Common spellings of the shuffle option, looked up before case folding
+SHUFFLE_OPTION_VALUES: Mapping[str, bool] = MappingProxyType(
+    {
+        "true": True,
+        "True": True,
+        "TRUE": True,
+        "false": False,
+        "False": False,
+        "FALSE": False,
+    }
+)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
 
+    # Keeps message and code out of a per-instance __dict__
+    __slots__ = ("message", "code")
+
     def __init__(self, message: str, code: int = 400):
         self.message = message
         self.code = code
         super().__init__(self.message)
 
 
-def validate_categories(selected_categories: List[str], valid_categories: List[str]) -> None:
+def validate_categories(
+    selected_categories: List[str], valid_categories: FrozenSet[str]
+) -> List[str]:
     """
     Validate selected categories.
 
     Args:
         selected_categories: List of categories selected by user
-        valid_categories: List of all valid category names
+        valid_categories: Set of all valid category names
+
+    Returns:
+        Selected categories with duplicates removed, in submission order
 
     Raises:
         ValidationError: If validation fails
     """
-    if not selected_categories or len(selected_categories) == 0:
+    if not selected_categories:
         raise ValidationError("Please select at least one category")
 
-    for category in selected_categories:
-        if category not in valid_categories:
-            raise ValidationError("Invalid category selection")
+    # Repeated form values must not multiply the work done per category
+    unique_categories = list(dict.fromkeys(selected_categories))
+
+    if not valid_categories.issuperset(unique_categories):
+        raise ValidationError("Invalid category selection")
+
+    return unique_categories
 
 
 def validate_num_questions(num_questions: Optional[int], available_questions: int) -> int:
@@ -54,13 +83,12 @@ def validate_num_questions(num_questions: Optional[int], available_questions: in
     Raises:
         ValidationError: If validation fails
     """
-    if num_questions is None or not isinstance(num_questions, int):
+    if type(num_questions) is not int:
         raise ValidationError("Number of questions must be a valid number")
 
-    if num_questions < 1:
-        raise ValidationError("Number of questions must be at least 1")
-
-    if num_questions > available_questions:
+    if not 1 <= num_questions <= available_questions:
+        if num_questions < 1:
+            raise ValidationError("Number of questions must be at least 1")
         raise ValidationError(
             f"Only {available_questions} questions available for selected categories"
         )
@@ -81,14 +109,14 @@ def validate_time_limit(time_limit: Optional[int]) -> int:
     Raises:
         ValidationError: If validation fails
     """
-    if time_limit is None or not isinstance(time_limit, int):
+    if type(time_limit) is not int:
         raise ValidationError("Time limit must be a valid number")
 
     if time_limit < MIN_TIME_LIMIT_MINUTES:
-        raise ValidationError(f"Time limit must be at least {MIN_TIME_LIMIT_MINUTES} minute(s)")
+        raise ValidationError(TIME_LIMIT_TOO_SHORT_MESSAGE)
 
     if time_limit > MAX_TIME_LIMIT_MINUTES:
-        raise ValidationError(f"Time limit cannot exceed {MAX_TIME_LIMIT_MINUTES} minutes")
+        raise ValidationError(TIME_LIMIT_TOO_LONG_MESSAGE)
 
     return time_limit
 
@@ -106,11 +134,13 @@ def validate_shuffle_option(shuffle_str: str) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    shuffle_lower = shuffle_str.lower()
-    if shuffle_lower not in ["true", "false"]:
+    shuffle = SHUFFLE_OPTION_VALUES.get(shuffle_str)
+    if shuffle is None and isinstance(shuffle_str, str):
+        # Any other mixed-case spelling is still accepted
+        shuffle = SHUFFLE_OPTION_VALUES.get(shuffle_str.lower())
+    if shuffle is None:
         raise ValidationError("Invalid shuffle option")
-
-    return shuffle_lower == "true"
+    return shuffle
 
 
 def validate_session_question_index(
@@ -129,13 +159,10 @@ def validate_session_question_index(
     Raises:
         ValidationError: If validation fails
     """
-    if q_index is None:
-        raise ValidationError("Invalid test session. Please start a new test.")
-
-    if not selected_indices or not isinstance(selected_indices, list):
+    if q_index is None or not selected_indices or not isinstance(selected_indices, list):
         raise ValidationError("Invalid test session. Please start a new test.")
 
-    if not isinstance(q_index, int) or q_index < 0:
+    if type(q_index) is not int or q_index < 0:
         raise ValidationError("Invalid question index")
 
     return q_index, selected_indices
@@ -152,11 +179,7 @@ def validate_question_index_in_range(question_index: int, total_questions: int)
     Raises:
         ValidationError: If validation fails
     """
-    if (
-        not isinstance(question_index, int)
-        or question_index < 0
-        or question_index >= total_questions
-    ):
+    if not (type(question_index) is int and 0 <= question_index < total_questions):
         raise ValidationError("Invalid question reference")
 
 
@@ -174,16 +197,9 @@ def validate_answer_index(answer_index: Any, num_options: int) -> Optional[int]:
     Raises:
         ValidationError: For invalid format (not for out-of-range)
     """
-    if answer_index is None:
-        return None
-
-    if not isinstance(answer_index, int):
-        return None
-
-    if answer_index < 0 or answer_index >= num_options:
-        return None
-
-    return answer_index
+    if type(answer_index) is int and 0 <= answer_index < num_options:
+        return answer_index
+    return None
 
 
 def validate_correct_answer_index(correct_index: int, num_options: int) -> None:
@@ -197,39 +213,33 @@ def validate_correct_answer_index(correct_index: int, num_options: int) -> None:
     Raises:
         ValidationError: If validation fails (500 error - data integrity issue)
     """
-    if not isinstance(correct_index, int) or correct_index < 0 or correct_index >= num_options:
+    if not (type(correct_index) is int and 0 <= correct_index < num_options):
         raise ValidationError("Invalid question configuration", code=500)
 
 
-def validate_wrong_answer_entry(wrong_answer: Any, total_questions: int) -> Optional[int]:
+def validate_wrong_answer_entry(wrong_answer: Any, num_selected: int) -> Optional[int]:
     """
     Validate a wrong answer entry from session.
 
     Args:
-        wrong_answer: Wrong answer dictionary from session
-        total_questions: Total number of questions
+        wrong_answer: Wrong answer entry from session, a [position, user_answer] pair
+        num_selected: Number of questions in the test
 
     Returns:
-        Valid question_index or None if invalid
+        Valid position of the question in the test or None if invalid
     """
-    if not isinstance(wrong_answer, dict):
+    if not isinstance(wrong_answer, (list, tuple)) or len(wrong_answer) != 2:
         return None
 
-    question_index: Any = wrong_answer.get("question_index")
-
-    if question_index is None or not isinstance(question_index, int):
-        return None
-
-    # At this point, mypy knows question_index is int due to isinstance check
-    validated_index: int = question_index
-
-    if validated_index < 0 or validated_index >= total_questions:
-        return None
+    position: Any = wrong_answer[0]
 
-    return validated_index
+    # Exact type check, so bools (an int subclass) are rejected too
+    if type(position) is int and 0 <= position < num_selected:
+        return position
+    return None
 
 
-def validate_question_data(question: Dict[str, Any]) -> None:
+def validate_question_data(question: Mapping[str, Any]) -> None:
     """
     Validate that question data has required fields.
 